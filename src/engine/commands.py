@@ -89,6 +89,7 @@ class SplitSegmentCommand(Command):
         target.text = source.text
         target.words = copy.deepcopy(source.words)
         target.status = source.status
+        self.manager.mark_changed()
 
 
 class MergeSegmentsCommand(Command):
@@ -134,8 +135,9 @@ class MergeSegmentsCommand(Command):
         # 2. Restore ALL original segments unconditionally
         # The merged segment reuses the first segment's ID, so after deletion
         # we need to re-add all originals including the first one.
-        for seg in self.original_segments:
-            self.manager.add_segment(copy.deepcopy(seg), save_undo=False)
+        self.manager.add_segments(
+            [copy.deepcopy(seg) for seg in self.original_segments], save_undo=False
+        )
 
 
 class DeleteSegmentsCommand(Command):
@@ -162,9 +164,14 @@ class DeleteSegmentsCommand(Command):
 
     def undo(self):
         # Restore all deleted segments
-        for seg in self.deleted_segments:
-            if not self.manager.get_segment(seg.id):
-                self.manager.add_segment(copy.deepcopy(seg), save_undo=False)
+        self.manager.add_segments(
+            [
+                copy.deepcopy(seg)
+                for seg in self.deleted_segments
+                if not self.manager.get_segment(seg.id)
+            ],
+            save_undo=False,
+        )
 
 
 class UpdateTextCommand(Command):
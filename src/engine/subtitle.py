@@ -5,6 +5,8 @@ Subtitle Data Model and Manager for ThinkSub2.
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Optional
+import bisect
+import itertools
 import uuid
 
 
@@ -15,7 +17,11 @@ class SegmentStatus(Enum):
     FINAL = auto()  # Generated by VAD End pass (stable, word-aligned)
 
 
-@dataclass
+# Name -> member lookup used when restoring saved projects
+STATUS_BY_NAME = {m.name: m for m in SegmentStatus}
+
+
+@dataclass(slots=True)
 class Word:
     """Represents a single word with timing information."""
 
@@ -25,7 +31,7 @@ class Word:
     probability: float = 1.0  # Internal confidence, NOT for UI display
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleSegment:
     """
     Represents a subtitle segment with timing and word-level data.
@@ -38,6 +44,10 @@ class SubtitleSegment:
     words: List[Word] = field(default_factory=list)
     status: SegmentStatus = SegmentStatus.DRAFT
     is_hidden: bool = False
+    # Set by STT padding; declared so slotted instances can hold it.
+    _original_start: Optional[float] = field(
+        default=None, repr=False, compare=False
+    )
 
     def duration(self) -> float:
         """Returns duration in seconds."""
@@ -73,10 +83,191 @@ class SubtitleManager:
         self._undo_stack: deque[List[SubtitleSegment]] = deque(maxlen=10)
         self._redo_stack: deque[List[SubtitleSegment]] = deque(maxlen=10)
 
+        # Sorted start-time index of visible segments (see find_nearest_segment)
+        self._version = 0
+        self._time_index: Optional[tuple] = None
+        self._last_time_pos = 0
+        # Last answer per lookup kind; scroll/playback sync re-asks the same t
+        self._lookup_memo: dict[str, tuple] = {}
+
     @property
     def segments(self) -> List[SubtitleSegment]:
         return self._segments
 
+    @property
+    def version(self) -> int:
+        """Edit counter; together with list identity and length it tells
+        whether the segments changed since an earlier snapshot."""
+        return self._version
+
+    def mark_changed(self):
+        """Invalidate cached time lookups after segments were edited in place."""
+        self._version += 1
+
+    def _get_time_index(self) -> tuple:
+        """Return (starts, segments) for visible segments sorted by start.
+
+        The cached index also holds each segment's end and the running maximum
+        of the ends, which find_segment_at uses to bound its walk over
+        overlapping segments.
+        """
+        index = self._time_index
+        if (
+            index is None
+            or index[0] is not self._segments
+            or index[1] != (len(self._segments), self._version)
+        ):
+            segs = sorted(
+                (s for s in self._segments if not s.is_hidden),
+                key=lambda s: s.start,
+            )
+            index = (
+                self._segments,
+                (len(self._segments), self._version),
+                [s.start for s in segs],
+                segs,
+                list(itertools.accumulate((s.end for s in segs), max)),
+                [s.end for s in segs],
+            )
+            self._time_index = index
+        return index[2], index[3]
+
+    def _candidates_at(self, t: float) -> List[SubtitleSegment]:
+        """Visible segments whose starts bracket t (at most two), via bisect."""
+        for _ in range(2):
+            starts, segs = self._get_time_index()
+            if not segs:
+                return []
+            idx = self._locate_start(starts, t)
+            picks = [i for i in (idx, idx + 1) if 0 <= i < len(segs)] or [0]
+            # Candidates edited in place without mark_changed(): rebuild once
+            if all(segs[i].start == starts[i] for i in picks):
+                break
+            self._time_index = None
+        return [segs[i] for i in picks]
+
+    def _locate_start(self, starts: List[float], t: float) -> int:
+        """bisect_right(starts, t) - 1, galloping out from the previous hit.
+
+        Scroll/playback queries move in small steps, so the answer is usually
+        at or next to the last position.
+        """
+        n = len(starts)
+        i = min(self._last_time_pos, n - 1)
+        if starts[i] <= t:
+            # Gallop right until starts[hi] > t
+            lo, step = i, 1
+            hi = i + 1
+            while hi < n and starts[hi] <= t:
+                lo = hi
+                step *= 2
+                hi = lo + step
+            idx = bisect.bisect_right(starts, t, lo, min(hi, n)) - 1
+        else:
+            # Gallop left until starts[lo] <= t
+            hi, step = i, 1
+            lo = i - 1
+            while lo >= 0 and starts[lo] > t:
+                hi = lo
+                step *= 2
+                lo = hi - step
+            idx = bisect.bisect_right(starts, t, max(lo, 0), hi) - 1
+        self._last_time_pos = max(idx, 0)
+        return idx
+
+    def find_nearest_segment(self, t: float) -> Optional[SubtitleSegment]:
+        """Find the visible segment containing t, else the one starting closest.
+
+        O(log n) bisect over a cached start index, rebuilt only when the
+        segment list changes.
+        """
+        hit, seg = self._memo_get("nearest", t)
+        if hit:
+            return seg
+        candidates = self._candidates_at(t)
+        result = None
+        if candidates:
+            for seg in candidates:
+                if seg.start <= t <= seg.end:
+                    result = seg
+                    break
+            else:
+                result = self._closer_start(candidates, t)
+        self._memo_put("nearest", t, result)
+        return result
+
+    def find_closest_start_segment(self, t: float) -> Optional[SubtitleSegment]:
+        """Find the visible segment whose start time is closest to t."""
+        hit, seg = self._memo_get("closest_start", t)
+        if hit:
+            return seg
+        candidates = self._candidates_at(t)
+        result = self._closer_start(candidates, t) if candidates else None
+        self._memo_put("closest_start", t, result)
+        return result
+
+    def find_segment_at(self, t: float) -> Optional[SubtitleSegment]:
+        """Find the visible segment with start <= t <= end, or None."""
+        for _ in range(2):
+            starts, segs = self._get_time_index()
+            if not segs:
+                return None
+            idx = self._locate_start(starts, t)
+            if idx < 0:
+                return None
+            # Candidate edited in place without mark_changed(): rebuild once
+            seg = segs[idx]
+            if seg.start == starts[idx] and seg.end == self._time_index[5][idx]:
+                break
+            self._time_index = None
+        # Earliest-starting segment containing t, like a forward scan. A long
+        # segment can cover t from far back (nested/overlapping lines), so
+        # walk back while some earlier segment still ends at or after t.
+        max_ends = self._time_index[4]
+        found = None
+        i = idx
+        while i >= 0 and max_ends[i] >= t:
+            if segs[i].end >= t:
+                found = segs[i]
+            i -= 1
+        return found
+
+    def _memo_get(self, kind: str, t: float) -> tuple:
+        """Return (hit, segment) for a repeat query at the same t and state."""
+        memo = self._lookup_memo.get(kind)
+        if (
+            memo is None
+            or memo[0] != t
+            or memo[1] is not self._segments
+            or memo[2] != (len(self._segments), self._version)
+        ):
+            return False, None
+        seg = memo[3]
+        # Guard against in-place edits made without mark_changed()
+        if seg is not None and (seg.start, seg.end) != memo[4]:
+            return False, None
+        return True, seg
+
+    def _memo_put(self, kind: str, t: float, seg: Optional[SubtitleSegment]):
+        self._lookup_memo[kind] = (
+            t,
+            self._segments,
+            (len(self._segments), self._version),
+            seg,
+            (seg.start, seg.end) if seg is not None else None,
+        )
+
+    @staticmethod
+    def _closer_start(
+        candidates: List[SubtitleSegment], t: float
+    ) -> SubtitleSegment:
+        # At most two candidates: compare directly instead of min(key=lambda)
+        first = candidates[0]
+        if len(candidates) == 1:
+            return first
+        second = candidates[1]
+        return second if abs(second.start - t) < abs(first.start - t) else first
+
     def _save_state(self):
         """Save current state for undo (deep copy)."""
         import copy
@@ -90,6 +281,17 @@ class SubtitleManager:
             self._save_state()
         self._segments.append(segment)
         self._segments.sort(key=lambda s: s.start)
+        self._version += 1
+
+    def add_segments(self, segments: List[SubtitleSegment], save_undo: bool = False):
+        """Add several segments with a single sort."""
+        if not segments:
+            return
+        if save_undo:
+            self._save_state()
+        self._segments.extend(segments)
+        self._segments.sort(key=lambda s: s.start)
+        self._version += 1
 
     def undo(self):
         """Revert to previous state. Returns previous state or False if none."""
@@ -131,6 +333,7 @@ class SubtitleManager:
                         setattr(seg, key, value)
                 break
 
+        self._version += 1
         if resolve_collision and active_seg:
             self._resolve_collisions(active_seg, close_small_gaps=close_small_gaps)
 
@@ -144,6 +347,7 @@ class SubtitleManager:
         seg = self.get_segment(segment_id)
         if seg:
             seg.text = new_text
+            self._version += 1
 
     def _resolve_collisions(
         self, active_seg: SubtitleSegment, close_small_gaps: bool = True
@@ -151,6 +355,7 @@ class SubtitleManager:
         """Push neighboring segments to avoid overlap."""
         # Sort first to ensure order
         self._segments.sort(key=lambda s: s.start)
+        self._version += 1
 
         try:
             idx = self._segments.index(active_seg)
@@ -199,6 +404,7 @@ class SubtitleManager:
             return
 
         self._segments.sort(key=lambda s: s.start)
+        self._version += 1
         for i in range(len(self._segments) - 1):
             a = self._segments[i]
             b = self._segments[i + 1]
@@ -216,6 +422,7 @@ class SubtitleManager:
             return
 
         self._segments.sort(key=lambda s: s.start)
+        self._version += 1
         for i in range(1, len(self._segments)):
             prev_seg = self._segments[i - 1]
             curr_seg = self._segments[i]
@@ -402,6 +609,7 @@ class SubtitleManager:
         """
         if save_undo:
             self._save_state()
+        self._version += 1
         for i, seg in enumerate(self._segments):
             if seg.id == segment_id:
                 if seg.start < split_time < seg.end:
@@ -553,11 +761,20 @@ class SubtitleManager:
                 s for s in self._segments if s.status != SegmentStatus.DRAFT
             ]
 
+    def set_segments(self, segments: List[SubtitleSegment]):
+        """Replace all segments at once (bulk load, clears undo history)."""
+        self._segments = sorted(segments, key=lambda s: s.start)
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._version += 1
+
     def clear(self):
         """Clear all segments."""
         self._segments.clear()
         self._undo_stack.clear()
         self._redo_stack.clear()
+        # Same list object: the time index would otherwise look current
+        self._version += 1
 
     def export_srt(self) -> str:
         """Export all segments as SRT format."""
@@ -7,8 +7,9 @@ import multiprocessing as mp
 from multiprocessing import Process, Queue
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, Dict, Any
-import time
+from typing import Optional, Dict, Any, Callable
+from collections import deque
+import threading
 import os
 import sys
 import json
@@ -101,6 +102,58 @@ class WhisperTranscriberProcess:
 
         self._is_ready = False
 
+        # GUI-side staging filled by relay threads (see start_relay)
+        self.pending_results: deque = deque()
+        self.pending_logs: deque = deque()
+        # Set by a relay thread when it notifies; the consumer clears the
+        # flag *before* draining, so an item appended after the drain always
+        # triggers a fresh notify (no lost wakeups)
+        self.results_notified = threading.Event()
+        self.logs_notified = threading.Event()
+        self._relay_threads: list[threading.Thread] = []
+
+    def start_relay(
+        self,
+        on_results: Optional[Callable[[], None]] = None,
+        on_logs: Optional[Callable[[], None]] = None,
+    ):
+        """Forward result/log queue items into local deques as they arrive.
+
+        A daemon thread per queue blocks on get() and calls the notify
+        callback once per burst, so the consumer is woken instead of polling.
+        The consumer must clear results_notified/logs_notified before it
+        drains the matching deque.
+        Call once from the owning (GUI) process.
+        """
+        if self._relay_threads:
+            return
+        for source, sink, notify, notified in (
+            (self.result_queue, self.pending_results, on_results, self.results_notified),
+            (self.log_queue, self.pending_logs, on_logs, self.logs_notified),
+        ):
+            t = threading.Thread(
+                target=self._relay_worker,
+                args=(source, sink, notify, notified),
+                daemon=True,
+            )
+            t.start()
+            self._relay_threads.append(t)
+
+    @staticmethod
+    def _relay_worker(
+        source: Queue, sink: deque, notify, notified: threading.Event
+    ):
+        while True:
+            try:
+                item = source.get()
+            except (EOFError, OSError):
+                return
+            sink.append(item)
+            # Only the first item since the consumer's last drain wakes it
+            if notify is not None and not notified.is_set():
+                notified.set()
+                notify()
+
     @staticmethod
     def _run_transcriber(
         audio_queue: Queue,
@@ -721,6 +774,7 @@ class WhisperTranscriberProcess:
                     )
 
                     batch_results = []
+                    sync_lines = []  # logged once per request, not per segment
 
                     segment_count = 0
                     for segment in segments:
@@ -741,7 +795,7 @@ class WhisperTranscriberProcess:
                             request.start_time + segment.end + time_correction
                         )
 
-                        log(
+                        sync_lines.append(
                             f"[Sync] Segment: Whisper={segment.start:.2f}-{segment.end:.2f} | Offset={request.start_time:.2f} | Abs={absolute_start:.2f}-{absolute_end:.2f}"
                         )
 
@@ -781,6 +835,9 @@ class WhisperTranscriberProcess:
                             # print(f"[Transcriber] Extending last segment end: {last_res.end:.2f} -> {request.end_time:.2f}")
                             last_res.end = request.end_time
 
+                    if sync_lines:
+                        log("\n".join(sync_lines))
+
                     if segment_count == 0:
                         log(
                             f"Whisper returned 0 segments for this audio chunk (RMS: {rms:.4f})"
@@ -802,8 +859,8 @@ class WhisperTranscriberProcess:
 
             except:
                 pass  # No audio in queue, continue loop
-
-            time.sleep(0.01)  # Small sleep to prevent CPU spinning
+            # No extra sleep: get(timeout=0.1) already blocks while idle, and
+            # a backlog of audio requests should be served back-to-back.
 
         log("Process terminated.")
 
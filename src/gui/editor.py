@@ -74,6 +74,8 @@ class SubtitleTableModel(QAbstractTableModel):
         super().__init__(parent)
         self._manager = manager
         self._ids: list[str] = [s.id for s in self._manager.segments]
+        # id -> row index, rebuilt lazily after the id list changes
+        self._row_of_id: Optional[dict[str, int]] = None
         self._playback_segment_id: Optional[str] = None
 
     def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
@@ -121,10 +123,9 @@ class SubtitleTableModel(QAbstractTableModel):
         return None
 
     def row_for_segment_id(self, segment_id: str) -> int:
-        try:
-            return self._ids.index(segment_id)
-        except ValueError:
-            return -1
+        if self._row_of_id is None:
+            self._row_of_id = {sid: row for row, sid in enumerate(self._ids)}
+        return self._row_of_id.get(segment_id, -1)
 
     def set_playback_segment(self, segment_id: Optional[str]):
         prev = self._playback_segment_id
@@ -142,35 +143,40 @@ class SubtitleTableModel(QAbstractTableModel):
     def sync_from_manager(self):
         self.beginResetModel()
         self._ids = [s.id for s in self._manager.segments]
+        self._row_of_id = None
         self.endResetModel()
 
     def apply_diff(self, added: list[str], removed: list[str], updated: list[str]):
         """Apply incremental updates to id list based on manager state."""
-        # Remove rows (from end)
+        # Remove rows (from end, so earlier rows keep their index)
         if removed:
-            for sid in sorted(
-                removed, key=lambda x: self.row_for_segment_id(x), reverse=True
-            ):
-                row = self.row_for_segment_id(sid)
+            rows = sorted(
+                {self.row_for_segment_id(sid) for sid in removed}, reverse=True
+            )
+            for row in rows:
                 if row < 0:
                     continue
                 self.beginRemoveRows(QModelIndex(), row, row)
                 del self._ids[row]
+                self._row_of_id = None
                 self.endRemoveRows()
 
         # Insert rows (in manager order)
         if added:
-            manager_ids = [s.id for s in self._manager.segments]
+            manager_pos = {s.id: i for i, s in enumerate(self._manager.segments)}
+            present = set(self._ids)
             for sid in added:
-                if sid not in manager_ids:
+                insert_at = manager_pos.get(sid)
+                if insert_at is None:
                     continue
-                if sid in self._ids:
+                if sid in present:
                     continue
-                insert_at = manager_ids.index(sid)
                 # Clamp
                 insert_at = max(0, min(insert_at, len(self._ids)))
                 self.beginInsertRows(QModelIndex(), insert_at, insert_at)
                 self._ids.insert(insert_at, sid)
+                self._row_of_id = None
+                present.add(sid)
                 self.endInsertRows()
 
         # Update rows
@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QCheckBox,
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QFont, QTextCursor
 from src.gui.magnetic import MagneticDialog
 from src.gui import i18n
@@ -43,6 +43,13 @@ class LogWindow(MagneticDialog):
         self._user_interacting = False
         self.log_file_path = self._init_log_file()
 
+        # Lines appended within one event-loop turn are flushed together
+        self._pending_lines: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending_logs)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -117,12 +124,40 @@ class LogWindow(MagneticDialog):
 
     @Slot(str)
     def append_log(self, message: str):
-        """Append a log message. Thread-safe via signal."""
-        self.log_text.append(message)
+        """Append a log message (buffered until the next event-loop turn).
+
+        GUI thread only: it touches a plain list and a QTimer. Other threads
+        must reach it through a queued signal connection.
+        """
+        self._pending_lines.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def append_logs(self, messages: list[str]):
+        """Append several log messages at once."""
+        if not messages:
+            return
+        self._pending_lines.extend(messages)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending_logs(self):
+        """Write buffered lines with one layout pass, file write and scroll."""
+        if not self._pending_lines:
+            return
+        lines = self._pending_lines
+        self._pending_lines = []
+
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            for message in lines:
+                self.log_text.append(message)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
 
         try:
             with open(self.log_file_path, "a", encoding="utf-8") as f:
-                f.write(message + "\n")
+                f.write("".join(m + "\n" for m in lines))
         except OSError:
             pass
 
@@ -132,6 +167,7 @@ class LogWindow(MagneticDialog):
 
     def _copy_to_clipboard(self):
         """Copy all log text to clipboard."""
+        self._flush_pending_logs()
         self.log_text.selectAll()
         self.log_text.copy()
         # Deselect
@@ -141,4 +177,5 @@ class LogWindow(MagneticDialog):
 
     def _clear_log(self):
         """Clear all log text."""
+        self._flush_pending_logs()
         self.log_text.clear()
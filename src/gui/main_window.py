@@ -8,14 +8,23 @@ import os
 import hashlib
 import tempfile
 import re
+from functools import partial
+from operator import attrgetter
+from collections import OrderedDict
+from pathlib import Path
+import shutil
 import uuid
-from src.gui.batch_stt_dialog import BatchSttDialog
 from src.gui import i18n
 from enum import Enum, auto
-from typing import Optional, Any, cast
+from typing import Optional, Any, Iterator, cast
 import json
+import copy
+import logging
 import threading
+import queue
 import subprocess
+import struct
+import wave
 import numpy as np
 
 from PySide6.QtWidgets import (
@@ -47,7 +56,6 @@ from PySide6.QtCore import (
     QSettings,
     Signal,
     QEvent,
-    QMetaObject,
     QSignalBlocker,
     QItemSelectionModel,
     QPoint,
@@ -55,7 +63,6 @@ from PySide6.QtCore import (
     QModelIndex,
     QRect,
 )
-from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtGui import (
     QAction,
     QIcon,
@@ -67,7 +74,13 @@ from PySide6.QtGui import (
     QCloseEvent,
 )
 
-from src.engine.subtitle import SubtitleManager, SubtitleSegment, Word, SegmentStatus
+from src.engine.subtitle import (
+    SubtitleManager,
+    SubtitleSegment,
+    Word,
+    SegmentStatus,
+    STATUS_BY_NAME,
+)
 from src.engine.audio import AudioRecorder, VADProcessor, AudioChunk
 from src.engine.transcriber import WhisperTranscriberProcess, TranscribeResult
 from src.engine.commands import (
@@ -82,7 +95,6 @@ from src.gui.log_window import LogWindow
 from src.gui.settings import SettingsDialog
 from src.gui.overlay import SubtitleOverlay
 from src.gui.editor import PlaybackState
-from src.gui.media_view import MediaViewWindow
 
 # Import JSON logger for structured logging
 try:
@@ -103,6 +115,184 @@ except ImportError:
         return f"req_{uuid.uuid4().hex[:8]}"
 
 
+def _chunks_to_int16(
+    chunks, out: Optional[np.ndarray] = None, scratch: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Convert float32 [-1, 1] chunks to one int16 buffer in a single pass.
+
+    Writes straight into a preallocated output through a per-chunk scratch
+    buffer, avoiding the full-size float32 concatenation. Callers converting
+    repeatedly can pass their own ``out`` (exact total length) and float32
+    ``scratch`` (at least the longest chunk) to skip the allocations.
+    """
+    total = sum(len(c) for c in chunks)
+    if out is None:
+        out = np.empty(total, dtype=np.int16)
+    if total == 0:
+        return out
+    longest = max(len(c) for c in chunks)
+    if scratch is None or len(scratch) < longest:
+        scratch = np.empty(longest, dtype=np.float32)
+    pos = 0
+    for chunk in chunks:
+        n = len(chunk)
+        if n == 0:
+            continue
+        buf = scratch[:n]
+        np.multiply(np.ravel(chunk), 32767.0, out=buf)
+        np.clip(buf, -32768.0, 32767.0, out=buf)
+        out[pos : pos + n] = buf  # float -> int16 cast truncates like astype
+        pos += n
+    return out
+
+
+# 44-byte RIFF/WAVE header of a mono 16-bit PCM file
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _pack_wav_header(n_samples: int, sample_rate: int = 16000) -> bytes:
+    """Return the WAV header for ``n_samples`` mono int16 samples."""
+    data_len = n_samples * 2
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,  # PCM fmt chunk size
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        data_len,
+    )
+
+
+def _write_pcm16_wav(path, samples: np.ndarray, sample_rate: int = 16000) -> None:
+    """Write mono int16 samples as a WAV file: fixed header, then the data.
+
+    The sizes are known up front, so unlike ``wave`` there is no header
+    patch-up seek after the frames are written.
+    """
+    with open(path, "wb") as f:
+        f.write(_pack_wav_header(samples.size, sample_rate))
+        f.write(np.ascontiguousarray(samples, dtype="<i2"))
+
+
+# Transcriber progress log line, e.g. "[진행률] 42% (...)"
+_PROGRESS_RE = re.compile(r"\[진행률\]\s+(\d+)%")
+_MEDIA_EXTS = frozenset({".mp3", ".wav", ".m4a", ".mp4", ".mkv", ".flac", ".aac"})
+_SRT_TIMING_RE = re.compile(
+    r"(\d+):(\d+):(\d+)[,.](\d+)\s*-->\s*(\d+):(\d+):(\d+)[,.](\d+)"
+)
+
+
+_THEME_QSS = {
+    "light": """
+        QWidget { background-color: #f2f2ee; color: #1f2937; }
+        QDialog { background-color: #f2f2ee; }
+        QTabWidget::pane { border: 1px solid #e0e0da; }
+        QTabBar::tab { background: #e8e8e2; padding: 8px 12px; margin-right: 2px; }
+        QTabBar::tab:selected { background: #fbfbf7; border-bottom: 2px solid #3b82f6; }
+        QGroupBox { border: 1px solid #e0e0da; margin-top: 1.5em; font-weight: bold; }
+        QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
+        QLabel { color: #1f2937; }
+        QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #fbfbf7; border: 1px solid #d6d6cf; padding: 4px; border-radius: 4px; color: #1f2937; }
+        QTableView { background-color: #fbfbf7; gridline-color: #e0e0da; color: #1f2937; selection-background-color: #3b82f6; selection-color: white; }
+        QTableWidget::item { padding: 4px; }
+        QHeaderView::section { background-color: #e8e8e2; padding: 4px; border: 1px solid #d6d6cf; }
+        QScrollBar:vertical { background: #f2f2ee; width: 12px; margin: 0px; }
+        QScrollBar::handle:vertical { background: #d6d6cf; min-height: 20px; border-radius: 6px; }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+        QToolBar { background-color: #fbfbf7; border-bottom: 1px solid #e0e0da; padding: 4px; spacing: 4px; }
+        QPushButton { background-color: #e8e8e2; color: #1f2937; border: none; padding: 6px 12px; border-radius: 4px; }
+        QPushButton:hover { background-color: #d6d6cf; }
+        QPushButton:checked { background-color: #3b82f6; color: white; }
+        QStatusBar { background-color: #fbfbf7; color: #4b5563; border-top: 1px solid #e0e0da; }
+        QSplitter::handle { background-color: #d6d6cf; width: 2px; }
+    """,
+    "navy": """
+        QWidget { background-color: #0a192f; color: #ccd6f6; }
+        QDialog { background-color: #0a192f; }
+        QTabWidget::pane { border: 1px solid #233554; }
+        QTabBar::tab { background: #112240; color: #8892b0; padding: 8px 12px; margin-right: 2px; }
+        QTabBar::tab:selected { background: #233554; color: #64ffda; border-bottom: 2px solid #64ffda; }
+        QGroupBox { border: 1px solid #233554; margin-top: 1.5em; font-weight: bold; color: #64ffda; }
+        QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
+        QLabel { color: #ccd6f6; }
+        QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #112240; border: 1px solid #233554; padding: 4px; border-radius: 4px; color: #ccd6f6; }
+        QTableView { background-color: #112240; gridline-color: #233554; color: #ccd6f6; selection-background-color: #233554; selection-color: #64ffda; }
+        QTableWidget::item { padding: 4px; }
+        QHeaderView::section { background-color: #0a192f; padding: 4px; border: 1px solid #233554; color: #8892b0; }
+        QScrollBar:vertical { background: #0a192f; width: 12px; margin: 0px; }
+        QScrollBar::handle:vertical { background: #233554; min-height: 20px; border-radius: 6px; }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+        QToolBar { background-color: #112240; border: none; padding: 4px; spacing: 4px; }
+        QPushButton { background-color: #233554; color: #ccd6f6; border: none; padding: 6px 12px; border-radius: 4px; }
+        QPushButton:hover { background-color: #303c55; }
+        QPushButton:checked { background-color: #64ffda; color: #0a192f; }
+        QStatusBar { background-color: #112240; color: #8892b0; }
+        QSplitter::handle { background-color: #233554; width: 2px; }
+    """,
+    # Dark (Default)
+    "dark": """
+        QWidget { background-color: #0f0f1a; color: #e5e7eb; }
+        QDialog { background-color: #0f0f1a; }
+        QTabWidget::pane { border: 1px solid #374151; }
+        QTabBar::tab { background: #1a1a2e; color: #9ca3af; padding: 8px 12px; margin-right: 2px; }
+        QTabBar::tab:selected { background: #374151; color: #e5e7eb; border-bottom: 2px solid #3b82f6; }
+        QGroupBox { border: 1px solid #374151; margin-top: 1.5em; font-weight: bold; color: #e5e7eb; }
+        QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
+        QLabel { color: #e5e7eb; }
+        QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #1a1a2e; border: 1px solid #374151; padding: 4px; border-radius: 4px; color: #e5e7eb; }
+        QTableView { background-color: #1a1a2e; gridline-color: #374151; color: #e5e7eb; selection-background-color: #374151; selection-color: #3b82f6; }
+        QTableWidget::item { padding: 4px; }
+        QHeaderView::section { background-color: #0f0f1a; padding: 4px; border: 1px solid #374151; color: #9ca3af; }
+        QScrollBar:vertical { background: #0f0f1a; width: 12px; margin: 0px; }
+        QScrollBar::handle:vertical { background: #374151; min-height: 20px; border-radius: 6px; }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+        QToolBar { background-color: #1a1a2e; border: none; padding: 4px; spacing: 4px; }
+        QPushButton { background-color: #374151; color: #e5e7eb; border: none; padding: 6px 12px; border-radius: 4px; }
+        QPushButton:hover { background-color: #4b5563; }
+        QPushButton:checked { background-color: #3b82f6; }
+        QStatusBar { background-color: #1a1a2e; color: #9ca3af; }
+        QSplitter::handle { background-color: #374151; width: 2px; }
+    """,
+}
+
+
+def _str_true(value) -> bool:
+    return str(value).lower() == "true"
+
+
+# Settings that map 1:1 onto a MainWindow attribute: key -> (attribute, convert)
+_SETTING_ATTRS = {
+    "min_text_length": ("_min_text_length", int),
+    "min_duration": ("_min_duration", float),
+    "max_duration": ("_max_duration", float),
+    "rms_threshold": ("_rms_threshold", float),
+    "stt_seg_endmin": ("_stt_seg_endmin", float),
+    "stt_extend_on_touch": ("_stt_extend_on_touch", _str_true),
+    "stt_pad_before": ("_stt_pad_before", float),
+    "stt_pad_after": ("_stt_pad_after", float),
+    "live_wordtimestamp_offset": ("_live_wordtimestamp_offset", float),
+    "live_pad_before": ("_live_pad_before", float),
+    "live_pad_after": ("_live_pad_after", float),
+}
+_VAD_SETTING_KEYS = frozenset(
+    {"vad_threshold", "vad_silence_duration", "fw_live_vad_speech_pad_ms"}
+)
+_MULTI_SELECTION_MODES = frozenset(
+    {
+        QAbstractItemView.SelectionMode.ExtendedSelection,
+        QAbstractItemView.SelectionMode.MultiSelection,
+        QAbstractItemView.SelectionMode.ContiguousSelection,
+    }
+)
+
+
 class AppState(Enum):
     """Application state machine."""
 
@@ -120,6 +310,10 @@ class MainWindow(QMainWindow):
 
     waveform_audio_loaded = Signal(object)  # np.ndarray
     media_proxy_ready = Signal(str, str)
+    subtitle_file_parsed = Signal(str, str, object, str, int)  # target, path, segments, error, seq
+    sidecar_srt_parsed = Signal(str, object, object, int)  # path, key, segments, seq
+    transcriber_results_ready = Signal()
+    transcriber_logs_ready = Signal()
 
     DEFAULT_ABBREV_WHITELIST = [
         "mr.",
@@ -187,7 +381,9 @@ class MainWindow(QMainWindow):
         self._audio_recorder = AudioRecorder()
 
         # Load VAD settings
-        settings = QSettings("ThinkSub", "ThinkSub2")
+        # Shared handle; QSettings instances in one process see each other's writes
+        self._settings = QSettings("ThinkSub", "ThinkSub2")
+        settings = self._settings
         vad_threshold = float(settings.value("vad_threshold", 0.02))
         vad_silence = float(settings.value("vad_silence_duration", 0.5))
 
@@ -203,6 +399,17 @@ class MainWindow(QMainWindow):
         self._stt_abbrev_whitelist = self._load_abbrev_whitelist(
             settings, "stt_abbrev_whitelist"
         )
+        self._abbrev_set_cache: dict[int, tuple] = {}  # see _get_abbrev_set
+        self._fw_cfg_cache: dict[str, dict] = {}  # see _get_fw_format_config
+        self._fw_params_cache: dict[str, dict] = {}  # see _build_fw_params_from_settings
+        # Mic index last handed to the recorder (None = system default)
+        self._current_mic_index: Optional[int] = None
+        # (raw string, parsed dict) of the last extra-params parse
+        self._fw_extra_cache: tuple[str, dict] = ("", {})
+        # fw_* inputs last pushed to the running transcriber (None: not yet)
+        self._fw_push_key: Optional[tuple] = None
+        # (font_size, opacity) for the media view; see _update_media_view_style
+        self._media_style_cache: Optional[tuple[int, float]] = None
         self._stt_seg_endmin = float(settings.value("stt_seg_endmin", 0.05))
         self._stt_extend_on_touch = (
             str(settings.value("stt_extend_on_touch", "false")).lower() == "true"
@@ -234,6 +441,8 @@ class MainWindow(QMainWindow):
         self._log_window: Optional[LogWindow] = None
         self._settings_dialog: Optional[SettingsDialog] = None
         self._media_dock: Optional[QDockWidget] = None
+        # Mirrors _media_dock visibility (kept by visibilityChanged)
+        self._media_visible = False
         self._media_view: Optional[Any] = None
 
         # Subtitle Overlay
@@ -248,14 +457,24 @@ class MainWindow(QMainWindow):
         self._file_stt_running = False
         self._transcriber_ready = False
         self._pending_file_transcribe: Optional[str] = None
+        # Resolved ffmpeg executable (cached after the first successful lookup)
+        self._ffmpeg_path: Optional[str] = None
 
         # Timers
+        # Results/logs are pushed by the transcriber relay (queued signals);
+        # these timers only gate draining and act as a slow watchdog.
         self._result_timer = QTimer()
         self._result_timer.timeout.connect(self._poll_results)
 
         self._log_timer = QTimer()
         self._log_timer.timeout.connect(self._poll_logs)
 
+        self.transcriber_results_ready.connect(self._on_transcriber_results_ready)
+        self.transcriber_logs_ready.connect(self._on_transcriber_logs_ready)
+        self._transcriber.start_relay(
+            self.transcriber_results_ready.emit, self.transcriber_logs_ready.emit
+        )
+
         self._status_timer = QTimer(self)
         self._status_timer.setSingleShot(True)
         self._status_timer.setInterval(80)
@@ -283,8 +502,25 @@ class MainWindow(QMainWindow):
         self._scroll_sync_timer = QTimer(self)
         self._scroll_sync_timer.setSingleShot(True)
         self._scroll_sync_timer.timeout.connect(self._flush_scroll_sync)
+        # Coalesce waveform cursor bursts (drag/click) to one sync per frame
+        self._cursor_sync_pending = None
+        self._cursor_sync_timer = QTimer(self)
+        self._cursor_sync_timer.setSingleShot(True)
+        self._cursor_sync_timer.setInterval(16)
+        self._cursor_sync_timer.timeout.connect(self._flush_cursor_sync)
         self._last_active_editor = None
         self._playback_active = False
+        # Either waveform playing; kept current by playback_started/finished
+        self._any_waveform_playing = False
+        self._current_theme: Optional[str] = None
+        self._subtitle_load_seq: dict[str, int] = {}
+        # (path, size, mtime_ns) -> ((start, end, text), ...) of recent sidecars
+        self._srt_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        # Right manager (list, len, version) when the current sidecar load began
+        self._sidecar_load_state: Optional[tuple] = None
+        # ((path, mtime_ns), int16 16 kHz mono samples) of the last full decode
+        self._decoded_audio_cache: Optional[tuple[tuple, np.ndarray]] = None
+        self._state_ui: Optional[dict] = None
         self._playback_toggle_lock = False
         self._suppress_cursor_sync_until = 0.0
         self._suppress_selection_sync_until = 0.0
@@ -333,20 +569,33 @@ class MainWindow(QMainWindow):
         self._first_speech_detected = False  # Flag for Virtual Silence Chunk
 
         # Recording Session Audio Collection
-        self._current_session_audio: list = []  # Collect audio chunks during recording
+        # Live audio is streamed to this WAV while recording (see _open_session_wav)
+        self._session_wav = None
+        self._session_wav_lock = threading.Lock()
+        # Reused int16/float32 buffers for converting chunks on the audio thread
+        self._session_pcm_buf: Optional[np.ndarray] = None
+        self._session_pcm_scratch: Optional[np.ndarray] = None
         self._current_session_wav_path: Optional[str] = None  # Path to saved WAV file
 
         self._setup_ui()
         self._setup_connections()
         self._media_proxy_tasks = set()
+        self._proxy_dir: Optional[str] = None
+        self._media_abspath_cache: dict[str, str] = {}
+        # Proxy encodes run one at a time on a single long-lived worker
+        self._media_proxy_jobs: queue.Queue = queue.Queue()
+        threading.Thread(target=self._media_proxy_worker_loop, daemon=True).start()
         self._media_pending_play = False
         self._media_pending_seek: Optional[float] = None
         self._media_debug_logged = False
         self._media_srt_path: Optional[str] = None
         self._use_media_proxy = False
         self._media_sync_debug_last = -1.0
+        # Skip media seeks when the cursor moved less than one video frame
+        self._media_sync_last_push = -1.0
+        self._media_sync_min_delta = 1.0 / 30
         self._preview_proxy_path: Optional[str] = None
-        self._batch_dialog: Optional[BatchSttDialog] = None
+        self._batch_dialog: Optional[Any] = None
         self._batch_queue: list[str] = []
         self._batch_running = False
         self._batch_cancel_requested = False
@@ -404,8 +653,13 @@ class MainWindow(QMainWindow):
         if app:
             app.installEventFilter(self)
 
-        self.waveform_audio_loaded.connect(self._on_waveform_audio_loaded)
+        # Queued: the array object itself is handed over, never copied
+        self.waveform_audio_loaded.connect(
+            self._on_waveform_audio_loaded, Qt.ConnectionType.QueuedConnection
+        )
         self.media_proxy_ready.connect(self._on_media_proxy_ready)
+        self.subtitle_file_parsed.connect(self._on_subtitle_file_parsed)
+        self.sidecar_srt_parsed.connect(self._on_sidecar_srt_parsed)
 
         # Apply dark theme
         self._apply_theme()
@@ -417,7 +671,7 @@ class MainWindow(QMainWindow):
         self._update_overlay_settings()
 
     def _update_overlay_settings(self):
-        settings = QSettings("ThinkSub", "ThinkSub2")
+        settings = self._settings
         self.overlay.update_style(
             font_size=int(settings.value("subtitle_font_size", 25)),
             max_chars=int(settings.value("subtitle_max_chars", 40)),
@@ -488,6 +742,21 @@ class MainWindow(QMainWindow):
             normalized.append(text)
         return normalized
 
+    def _get_abbrev_set(self, whitelist: list[str]) -> frozenset[str]:
+        """Normalized whitelist as a set, cached per whitelist list object.
+
+        Settings changes assign a new list, so identity is enough to notice.
+        """
+        cache = self._abbrev_set_cache
+        entry = cache.get(id(whitelist))
+        if entry is not None and entry[0] is whitelist:
+            return entry[1]
+        if len(cache) > 4:
+            cache.clear()
+        abbrevs = frozenset(self._normalize_abbrev_list(whitelist))
+        cache[id(whitelist)] = (whitelist, abbrevs)
+        return abbrevs
+
     def _load_abbrev_whitelist(self, settings: QSettings, key: str) -> list[str]:
         raw = settings.value(key, None)
         if raw is None:
@@ -495,7 +764,14 @@ class MainWindow(QMainWindow):
         return self._normalize_abbrev_list(raw)
 
     def _get_fw_format_config(self, mode: str = "live") -> dict:
-        """Get effective formatting config; extra JSON overrides fw_* if present."""
+        """Get effective formatting config; extra JSON overrides fw_* if present.
+
+        Cached per mode until _on_settings_changed; callers must not mutate it.
+        """
+        cached = self._fw_cfg_cache.get(mode)
+        if cached is not None:
+            return cached
+
         prefix = f"fw_{mode}_"
 
         settings = QSettings("ThinkSub", "ThinkSub2")
@@ -529,15 +805,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        self._fw_cfg_cache[mode] = cfg
         return cfg
 
     def _pick_text_at_time(self, mgr: SubtitleManager, t: float) -> str:
-        for seg in mgr.segments:
-            if getattr(seg, "is_hidden", False):
-                continue
-            if seg.start <= t <= seg.end:
-                return (seg.text or "").strip()
-        return ""
+        seg = mgr.find_segment_at(t)
+        return (seg.text or "").strip() if seg is not None else ""
 
     def _wrap_text(
         self, text: str, max_width: int, max_lines: int, max_comma_cent: int
@@ -612,44 +885,45 @@ class MainWindow(QMainWindow):
         h = total_minutes // 60
         return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
-    def _parse_srt_time(self, value: str) -> Optional[float]:
-        match = re.match(r"(\d+):(\d+):(\d+)[,.](\d+)", value.strip())
-        if not match:
-            return None
-        h, m, s, ms = match.groups()
-        return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
-
-    def _parse_srt_file(self, path: str) -> list[SubtitleSegment]:
+    def _iter_srt_file(self, path: str) -> Iterator[SubtitleSegment]:
+        """Yield segments block by block while reading the file line by line."""
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            with open(path, "r", encoding="utf-8-sig", errors="ignore") as f:
+                block: list[str] = []
+                for raw in f:
+                    line = raw.strip("\r\n")
+                    if line.strip():
+                        block.append(line)
+                        continue
+                    if block:
+                        seg = self._srt_block_to_segment(block)
+                        if seg is not None:
+                            yield seg
+                        block = []
+                if block:
+                    seg = self._srt_block_to_segment(block)
+                    if seg is not None:
+                        yield seg
         except OSError:
-            return []
+            return
 
-        blocks = re.split(r"\n\s*\n", content.strip())
-        segments: list[SubtitleSegment] = []
-        for block in blocks:
-            lines = [ln.strip("\r") for ln in block.splitlines() if ln.strip()]
-            if len(lines) < 2:
-                continue
-            time_line = lines[1] if "-->" in lines[1] else lines[0]
-            if "-->" not in time_line:
-                continue
-            start_str, end_str = [p.strip() for p in time_line.split("-->")]
-            start = self._parse_srt_time(start_str)
-            end = self._parse_srt_time(end_str)
-            if start is None or end is None:
-                continue
-            text_lines = lines[2:] if "-->" in lines[1] else lines[1:]
-            text = "\n".join(text_lines).strip()
-            if not text:
-                continue
-            segments.append(
-                SubtitleSegment(
-                    start=start, end=end, text=text, status=SegmentStatus.FINAL
-                )
-            )
-        return segments
+    def _srt_block_to_segment(self, lines: list[str]) -> Optional[SubtitleSegment]:
+        if len(lines) < 2:
+            return None
+        text_from = 2 if "-->" in lines[1] else 1
+        match = _SRT_TIMING_RE.match(lines[text_from - 1].strip())
+        if not match:
+            return None
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups())
+        text = "\n".join(lines[text_from:]).strip()
+        if not text:
+            return None
+        return SubtitleSegment(
+            start=h1 * 3600 + m1 * 60 + s1 + ms1 / 1000.0,
+            end=h2 * 3600 + m2 * 60 + s2 + ms2 / 1000.0,
+            text=text,
+            status=SegmentStatus.FINAL,
+        )
 
     def _write_srt_file(self, path: str, segments: list[SubtitleSegment]) -> bool:
         try:
@@ -668,12 +942,25 @@ class MainWindow(QMainWindow):
         except OSError:
             return False
 
+    def _get_proxy_dir(self) -> str:
+        """Return the proxy temp directory, creating it on first use."""
+        if self._proxy_dir is None:
+            proxy_dir = os.path.join(tempfile.gettempdir(), "thinksub_proxy")
+            os.makedirs(proxy_dir, exist_ok=True)
+            self._proxy_dir = proxy_dir
+        return self._proxy_dir
+
+    def _media_abspath(self, src_path: str) -> str:
+        base = self._media_abspath_cache.get(src_path)
+        if base is None:
+            base = os.path.abspath(src_path)
+            self._media_abspath_cache[src_path] = base
+        return base
+
     def _get_media_srt_path(self, src_path: str) -> str:
-        base = os.path.abspath(src_path)
-        digest = hashlib.md5(base.encode("utf-8")).hexdigest()
-        proxy_dir = os.path.join(tempfile.gettempdir(), "thinksub_proxy")
-        os.makedirs(proxy_dir, exist_ok=True)
-        return os.path.join(proxy_dir, f"subs_{digest}.srt")
+        base = self._media_abspath(src_path)
+        digest = hashlib.blake2b(base.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self._get_proxy_dir(), f"subs_{digest}.srt")
 
     def _ffmpeg_escape_filter_path(self, path: str) -> str:
         norm = path.replace("\\", "/")
@@ -710,12 +997,7 @@ class MainWindow(QMainWindow):
         if self._log_window:
             self._log_window.append_log(f"[MediaProxy] SRT updated: {srt_path}")
         proxy_path = self._ensure_media_proxy_async(self._selected_media_file, srt_path)
-        if (
-            proxy_path
-            and self._media_view
-            and self._media_dock
-            and self._media_dock.isVisible()
-        ):
+        if proxy_path and self._media_view and self._media_visible:
             self._media_view.ensure_media_loaded(proxy_path)
 
     def _split_final_by_words(
@@ -864,8 +1146,8 @@ class MainWindow(QMainWindow):
         self._popup_editor = SubtitlePopupEditor(self)
         self._popup_editor.text_saved.connect(self._on_popup_text_saved)
         self._popup_editor.playback_requested.connect(self._toggle_playback)
-        self._popup_editor.prev_requested.connect(lambda: self._navigate_popup(-1))
-        self._popup_editor.next_requested.connect(lambda: self._navigate_popup(1))
+        self._popup_editor.prev_requested.connect(partial(self._navigate_popup, -1))
+        self._popup_editor.next_requested.connect(partial(self._navigate_popup, 1))
 
         self.editor_splitter.setSizes([500, 500])
         self.main_splitter.addWidget(self.editor_splitter)
@@ -1149,7 +1431,7 @@ class MainWindow(QMainWindow):
             self._update_status(i18n.tr("자석 모드: 꺼짐"))
 
     def _on_split_clicked(self):
-        if self._is_waveform_playing():
+        if self._any_waveform_playing:
             self._update_status("재생 중에는 분할할 수 없습니다.")
             return
         editor = self._get_active_editor()
@@ -1250,7 +1532,7 @@ class MainWindow(QMainWindow):
         self.waveform_right.refresh_segments(self._file_subtitle_manager.segments)
 
     def _on_merge_clicked(self):
-        if self._is_waveform_playing():
+        if self._any_waveform_playing:
             self._update_status("재생 중에는 병합할 수 없습니다.")
             return
         editor = self._get_active_editor()
@@ -1398,6 +1680,49 @@ class MainWindow(QMainWindow):
             # No path, ask for "Save As"
             return self._save_project_as()
 
+    def _copy_session_wav(
+        self, src: str, dst: str, data_len: Optional[int] = None
+    ) -> None:
+        """Copy the session WAV, cloning it in-kernel when the FS supports it.
+
+        ``data_len`` is the PCM byte count snapshotted while the file is
+        still being recorded; only that much is copied and the header sizes
+        are patched to match.
+        """
+        if data_len is not None:
+            self._copy_wav_prefix(src, dst, data_len)
+            return
+        try:
+            import fcntl
+
+            FICLONE = 0x40049409  # btrfs/xfs copy-on-write clone
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except (ImportError, OSError):
+            pass
+        # shutil.copy2 already uses os.sendfile (Linux) / fcopyfile (macOS)
+        shutil.copy2(src, dst)
+
+    @staticmethod
+    def _copy_wav_prefix(src: str, dst: str, data_len: int) -> None:
+        """Copy the 44-byte PCM header plus ``data_len`` bytes, then fix sizes."""
+        remaining = 44 + data_len
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while remaining > 0:
+                chunk = fsrc.read(min(remaining, 1 << 20))
+                if not chunk:
+                    break
+                fdst.write(chunk)
+                remaining -= len(chunk)
+            # The recorder keeps patching the source header as it grows
+            copied = 44 + data_len - remaining
+            fdst.seek(4)
+            fdst.write(struct.pack("<I", copied - 8))
+            fdst.seek(40)
+            fdst.write(struct.pack("<I", copied - 44))
+
     def _save_project_file(self, file_path: str):
         """Internal helper to save project to specific path."""
         try:
@@ -1406,26 +1731,22 @@ class MainWindow(QMainWindow):
             if self._current_session_wav_path and os.path.exists(
                 self._current_session_wav_path
             ):
-                # Use existing temp WAV file
-                audio_dir = os.path.join(os.path.dirname(file_path), "audio")
-                os.makedirs(audio_dir, exist_ok=True)
-                audio_base = os.path.splitext(os.path.basename(file_path))[0]
-                audio_wav_path = os.path.join(audio_dir, f"{audio_base}.wav")
-                import shutil
-
-                shutil.copy2(self._current_session_wav_path, audio_wav_path)
-            elif self._current_session_audio:
-                # Create new WAV from chunks (fallback)
-                from scipy.io import wavfile
-
+                # Use existing temp WAV file (may still be recording)
                 audio_dir = os.path.join(os.path.dirname(file_path), "audio")
                 os.makedirs(audio_dir, exist_ok=True)
                 audio_base = os.path.splitext(os.path.basename(file_path))[0]
                 audio_wav_path = os.path.join(audio_dir, f"{audio_base}.wav")
-                full_audio = np.concatenate(self._current_session_audio)
-                audio_int16 = (full_audio * 32767).astype(np.int16)
-                wavfile.write(
-                    audio_wav_path, AudioRecorder.MODEL_SAMPLE_RATE, audio_int16
+                # Snapshot the recorded length under the lock, copy outside it
+                # so the audio callback's writeframes is not stalled
+                with self._session_wav_lock:
+                    wf = self._session_wav
+                    data_len = (
+                        wf.getnframes() * wf.getsampwidth() * wf.getnchannels()
+                        if wf is not None
+                        else None
+                    )
+                self._copy_session_wav(
+                    self._current_session_wav_path, audio_wav_path, data_len
                 )
 
             # If no live recording, check if we have an external media file open
@@ -1487,7 +1808,7 @@ class MainWindow(QMainWindow):
             QApplication.processEvents()
 
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write(json.dumps(data, ensure_ascii=False, indent=2))
 
             self._current_project_path = file_path
             self._current_project_path = file_path
@@ -1746,8 +2067,7 @@ class MainWindow(QMainWindow):
 
     def _import_subtitles_from_dict(self, manager, data: list[dict]):
         """Import segments from dictionary format to subtitle manager."""
-        from src.engine.subtitle import SubtitleSegment, Word, SegmentStatus
-
+        new_segments = []
         for seg_data in data:
             words = []
             if seg_data.get("words"):
@@ -1756,12 +2076,10 @@ class MainWindow(QMainWindow):
                     for w in seg_data["words"]
                 ]
 
+            status_name = seg_data.get("status")
             status = SegmentStatus.DRAFT
-            if isinstance(seg_data.get("status"), str):
-                try:
-                    status = SegmentStatus[seg_data["status"]]
-                except (KeyError, ValueError):
-                    status = SegmentStatus.DRAFT
+            if isinstance(status_name, str):
+                status = STATUS_BY_NAME.get(status_name, SegmentStatus.DRAFT)
 
             segment = SubtitleSegment(
                 id=seg_data.get("id", str(uuid.uuid4())),
@@ -1784,10 +2102,10 @@ class MainWindow(QMainWindow):
                     if w.start > w.end:
                         w.end = w.start  # 0 duration
 
-            manager._segments.append(segment)
+            new_segments.append(segment)
 
-        # Enforce sort order
-        manager._segments.sort(key=lambda s: s.start)
+        # Attach in one step (single sort, invalidates the time index)
+        manager.add_segments(new_segments)
 
     def _setup_connections(self):
         """Setup signal connections."""
@@ -1913,7 +2231,7 @@ class MainWindow(QMainWindow):
             # BLOCK if in programmatic scroll mode (prevent loops from scrollTo → valueChanged)
             if getattr(self, "_programmatic_scroll_guard", False):
                 self._debug_log(
-                    f"[SCROLL→CURSOR] BLOCKED programmatic scroll source={source}"
+                    "[SCROLL→CURSOR] BLOCKED programmatic scroll source=%s", source
                 )
                 return
 
@@ -1991,14 +2309,18 @@ class MainWindow(QMainWindow):
 
             scroll_dir = "DOWN" if value > self._last_scroll_value else "UP"
             self._debug_log(
-                f"[SCROLL→CURSOR] source={source}, row={row}, t={t:.3f}s (USER SCROLL, {scroll_dir})"
+                "[SCROLL→CURSOR] source=%s, row=%s, t=%.3fs (USER SCROLL, %s)",
+                source,
+                row,
+                t,
+                scroll_dir,
             )
 
             # Throttle rapid scroll events - only process the latest
             # If there's already a pending request, just update it (coalescing)
             if self._scroll_throttle_timer.isActive():
                 self._scroll_throttle_pending = (source, t, row)
-                self._debug_log(f"[SCROLL→CURSOR] THROTTLE pending row={row}")
+                self._debug_log("[SCROLL→CURSOR] THROTTLE pending row=%s", row)
                 return
 
             # Start throttle timer
@@ -2016,7 +2338,7 @@ class MainWindow(QMainWindow):
             )
 
         except Exception as e:
-            self._debug_log(f"[SCROLL→CURSOR][ERR] {type(e).__name__}: {e}")
+            self._debug_log("[SCROLL→CURSOR][ERR] %s: %s", type(e).__name__, e)
 
     def _on_scroll_cursor_time_changed(
         self, source: str, t: float, forced_row: Optional[int] = None
@@ -2053,7 +2375,7 @@ class MainWindow(QMainWindow):
 
         if row is None or row < 0:
             self._debug_log(
-                f"[FOLLOW_SUBTITLE] t={t:.3f}s source={source}: row not found, skip"
+                "[FOLLOW_SUBTITLE] t=%.3fs source=%s: row not found, skip", t, source
             )
             return
 
@@ -2068,7 +2390,9 @@ class MainWindow(QMainWindow):
             # Already processing - COALESCE
             self._follow_pending = (t, source)
             self._debug_log(
-                f"[FOLLOW_SUBTITLE] COALESCE re-entrant, storing pending t={t:.3f}s source={source}"
+                "[FOLLOW_SUBTITLE] COALESCE re-entrant, storing pending t=%.3fs source=%s",
+                t,
+                source,
             )
             return
 
@@ -2079,7 +2403,7 @@ class MainWindow(QMainWindow):
         # DEDUPLICATION: skip if same (source, row) as last processed follow
         follow_key = (source, row)
         if hasattr(self, "_follow_impl_key") and self._follow_impl_key == follow_key:
-            self._debug_log(f"[FOLLOW_SUBTITLE] SKIP duplicate follow_key={follow_key}")
+            self._debug_log("[FOLLOW_SUBTITLE] SKIP duplicate follow_key=%s", follow_key)
             self._scroll_follow_active = False
             return
 
@@ -2087,7 +2411,9 @@ class MainWindow(QMainWindow):
             # Update global master time and source
             self._scroll_cursor_t = t
             self._scroll_cursor_source = source
-            self._debug_log(f"[FOLLOW_SUBTITLE] t={t:.3f}s source={source} row={row}")
+            self._debug_log(
+                "[FOLLOW_SUBTITLE] t=%.3fs source=%s row=%s", t, source, row
+            )
 
             # Apply to BOTH waveforms with emit=False (no recursion)
             self.waveform_left.set_scroll_cursor_pos(t, emit=False)
@@ -2128,7 +2454,9 @@ class MainWindow(QMainWindow):
             pending_t, pending_source = self._follow_pending
             self._follow_pending = None
             self._debug_log(
-                f"[FOLLOW_SUBTITLE] Processing pending t={pending_t:.3f}s source={pending_source}"
+                "[FOLLOW_SUBTITLE] Processing pending t=%.3fs source=%s",
+                pending_t,
+                pending_source,
             )
             from PySide6.QtCore import QTimer
 
@@ -2170,71 +2498,62 @@ class MainWindow(QMainWindow):
             model = getattr(editor, "_model", None)
             if model is None:
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: no model for forced_row={row}"
+                    "[FOLLOW_SUBTITLE] %s: no model for forced_row=%s", editor_name, row
                 )
                 return
             segment_id = model.segment_id_at_row(row)
             if not segment_id:
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: no segment_id at forced_row={row}"
+                    "[FOLLOW_SUBTITLE] %s: no segment_id at forced_row=%s",
+                    editor_name,
+                    row,
                 )
                 return
             target_seg = manager.get_segment(segment_id)
             if not target_seg:
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: segment not found for segment_id at forced_row={row}"
+                    "[FOLLOW_SUBTITLE] %s: segment not found for segment_id at forced_row=%s",
+                    editor_name,
+                    row,
                 )
                 return
             self._debug_log(
-                f"[FOLLOW_SUBTITLE] {editor_name}: t={t:.3f}s -> segment idx={row} [{target_seg.start:.3f}-{target_seg.end:.3f}s] (FORCED)"
+                "[FOLLOW_SUBTITLE] %s: t=%.3fs -> segment idx=%s [%.3f-%.3fs] (FORCED)",
+                editor_name,
+                t,
+                row,
+                target_seg.start,
+                target_seg.end,
             )
         else:
             # Find segment aligned to time t.
             # Prefer segment that CONTAINS t, otherwise pick the closest-by-start around t.
-            import bisect
-
-            segments_sorted = sorted(manager.segments, key=lambda s: s.start)
-            if not segments_sorted:
-                self._debug_log(f"[FOLLOW_SUBTITLE] {editor_name}: no segments")
-                return
-
-            starts = [s.start for s in segments_sorted]
-            idx = bisect.bisect_right(starts, t) - 1
-
-            candidates = []
-            if 0 <= idx < len(segments_sorted):
-                candidates.append(segments_sorted[idx])
-            if 0 <= idx + 1 < len(segments_sorted):
-                candidates.append(segments_sorted[idx + 1])
-            if not candidates:
-                candidates = [segments_sorted[0]]
-
-            # 1) If any candidate contains t, use it.
-            target_seg = None
-            for seg in candidates:
-                if seg.start <= t <= seg.end:
-                    target_seg = seg
-                    break
-
-            # 2) Else choose closest start time.
+            target_seg = manager.find_nearest_segment(t)
             if target_seg is None:
-                target_seg = min(candidates, key=lambda s: abs(s.start - t))
+                self._debug_log("[FOLLOW_SUBTITLE] %s: no segments", editor_name)
+                return
 
-            seg_start, seg_end = target_seg.start, target_seg.end
-            in_segment = "IN" if seg_start <= t <= seg_end else "NEAR"
-            self._debug_log(
-                f"[FOLLOW_SUBTITLE] {editor_name}: t={t:.3f}s -> segment [{seg_start:.3f}-{seg_end:.3f}s] ({in_segment})"
-            )
+            if self._scroll_sync_debug:
+                seg_start, seg_end = target_seg.start, target_seg.end
+                in_segment = "IN" if seg_start <= t <= seg_end else "NEAR"
+                self._debug_log(
+                    "[FOLLOW_SUBTITLE] %s: t=%.3fs -> segment [%.3f-%.3fs] (%s)",
+                    editor_name,
+                    t,
+                    seg_start,
+                    seg_end,
+                    in_segment,
+                )
 
             # Get row for this segment
             row = editor._get_row_of_segment(target_seg.id)
             if row < 0:
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: row not found for segment"
+                    "[FOLLOW_SUBTITLE] %s: row not found for segment", editor_name
                 )
                 return
 
-        self._debug_log(f"[FOLLOW_SUBTITLE] {editor_name}: row={row}")
+        self._debug_log("[FOLLOW_SUBTITLE] %s: row=%s", editor_name, row)
 
         model = getattr(editor, "_model", None)
         if model is None:
@@ -2267,8 +2586,12 @@ class MainWindow(QMainWindow):
             # Do NOT block signals here.
             editor.table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
             self._debug_log(
-                f"[FOLLOW_SUBTITLE] {editor_name}: scrollTo PositionAtTop row={row} "
-                f"(source={from_source}, apply_sel={apply_selection})"
+                "[FOLLOW_SUBTITLE] %s: scrollTo PositionAtTop row=%s "
+                "(source=%s, apply_sel=%s)",
+                editor_name,
+                row,
+                from_source,
+                apply_selection,
             )
 
             # Selection: ONLY on source side
@@ -2279,13 +2602,14 @@ class MainWindow(QMainWindow):
                     | QItemSelectionModel.SelectionFlag.Rows,
                 )
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: selection set (SOURCE)"
+                    "[FOLLOW_SUBTITLE] %s: selection set (SOURCE)", editor_name
                 )
             else:
                 # Opposite side: clear existing selection only, NO new selection
                 sel_model.clearSelection()
                 self._debug_log(
-                    f"[FOLLOW_SUBTITLE] {editor_name}: selection cleared (OPPOSITE - no new selection)"
+                    "[FOLLOW_SUBTITLE] %s: selection cleared (OPPOSITE - no new selection)",
+                    editor_name,
                 )
         finally:
             editor.blockSignals(original_block_state)
@@ -2299,12 +2623,12 @@ class MainWindow(QMainWindow):
             return
 
         self._user_scroll_active = True
-        self._debug_log(f"[USER_SCROLL] detected source={source}, active=True")
+        self._debug_log("[USER_SCROLL] detected source=%s, active=True", source)
 
     def _on_user_scroll_resume(self) -> None:
         """Resume auto-follow after user scroll timeout."""
         self._user_scroll_active = False
-        self._debug_log(f"[USER_SCROLL] resumed, active=False")
+        self._debug_log("[USER_SCROLL] resumed, active=False")
 
     def _get_time_at_view_y(
         self, editor: SubtitleEditor, manager: SubtitleManager, y: int
@@ -2323,19 +2647,32 @@ class MainWindow(QMainWindow):
             return None
         return float(seg.start)
 
-    def _get_selected_row_y(self, editor: SubtitleEditor) -> Optional[int]:
-        rows = editor.table.selectionModel().selectedRows()
-        if not rows:
+    def _row_center_y(self, editor: SubtitleEditor, row: int) -> Optional[int]:
+        # Read the vertical header's section offsets directly; visualRect
+        # would also resolve the column span just to take the row's center.
+        table = editor.table
+        if row < 0 or table.isRowHidden(row):
             return None
-        row = rows[0].row()
-        model = getattr(editor, "_model", None)
-        if model is None:
+        return table.rowViewportPosition(row) + table.rowHeight(row) // 2
+
+    def _get_selected_row_y(self, editor: SubtitleEditor) -> Optional[int]:
+        sm = editor.table.selectionModel()
+        if sm is None:
             return None
-        idx = model.index(row, 0)
-        rect = editor.table.visualRect(idx)
-        if rect.isNull():
+        # Single-row selection (the common case): the current row is the
+        # answer. Multi-selections keep the first selected row as the anchor,
+        # so only modes that allow them pay for selectedRows().
+        idx = editor.table.currentIndex()
+        if idx.isValid() and sm.isRowSelected(idx.row(), idx.parent()):
+            if editor.table.selectionMode() in _MULTI_SELECTION_MODES:
+                rows = sm.selectedRows()
+                if len(rows) > 1:
+                    return self._row_center_y(editor, rows[0].row())
+            return self._row_center_y(editor, idx.row())
+        rows = sm.selectedRows()
+        if not rows:
             return None
-        return rect.center().y()
+        return self._row_center_y(editor, rows[0].row())
 
     def _get_row_y_by_time(
         self, editor: SubtitleEditor, manager: SubtitleManager, t: float
@@ -2343,17 +2680,7 @@ class MainWindow(QMainWindow):
         row = self._find_row_by_time(editor, manager, t)
         if row is None:
             return None
-        model = getattr(editor, "_model", None)
-        if model is None:
-            return None
-        idx = model.index(row, 0)
-        rect = editor.table.visualRect(idx)
-        if rect.isNull():
-            editor.table.scrollTo(idx, QAbstractItemView.ScrollHint.PositionAtTop)
-            rect = editor.table.visualRect(idx)
-            if rect.isNull():
-                return None
-        return rect.center().y()
+        return self._row_center_y(editor, row)
 
     def _find_row_by_time(
         self, editor: SubtitleEditor, manager: SubtitleManager, t: float
@@ -2362,33 +2689,13 @@ class MainWindow(QMainWindow):
         if model is None:
             return None
 
-        best_row: Optional[int] = None
-        best_dist: Optional[float] = None
-        for row in range(model.rowCount()):
-            sid = model.segment_id_at_row(row)
-            if not sid:
-                continue
-            seg = manager.get_segment(sid)
-            if not seg or getattr(seg, "is_hidden", False):
-                continue
-            dist = abs(seg.start - t)
-            if best_dist is None or dist < best_dist:
-                best_dist = dist
-                best_row = row
-        return best_row
-
-    def _parse_editor_time_value(self, value: str) -> Optional[float]:
-        if not value:
-            return None
-        parts = value.strip().split(":")
-        if len(parts) != 2:
+        # Bisect the manager's cached start index, then map the winner to a
+        # row via the model's id->row map.
+        best_seg = manager.find_closest_start_segment(t)
+        if best_seg is None:
             return None
-        try:
-            minutes = int(parts[0])
-            seconds = float(parts[1])
-        except ValueError:
-            return None
-        return minutes * 60 + seconds
+        row = model.row_for_segment_id(best_seg.id)
+        return row if row >= 0 else None
 
     def _scroll_editor_by_time_aligned(
         self,
@@ -2406,6 +2713,12 @@ class MainWindow(QMainWindow):
         segment_id = model.segment_id_at_row(row)
         if not segment_id:
             return
+        # Both scroll paths center the row; skip the repaint if it already is
+        y_cur = self._row_center_y(editor, row)
+        if y_cur is not None:
+            center_y = editor.table.viewport().height() // 2
+            if abs(y_cur - center_y) < editor.table.rowHeight(row) / 2:
+                return
         if desired_y is None:
             editor.scroll_to_segment(segment_id)
         else:
@@ -2488,6 +2801,18 @@ class MainWindow(QMainWindow):
             return
         if self._scroll_sync_active:
             return
+        # Keep only the latest position; the timer applies it once
+        self._cursor_sync_pending = (source, t)
+        if not self._cursor_sync_timer.isActive():
+            self._cursor_sync_timer.start()
+
+    def _flush_cursor_sync(self) -> None:
+        if not self._cursor_sync_pending:
+            return
+        source, t = self._cursor_sync_pending
+        self._cursor_sync_pending = None
+        if self._playback_active or self._scroll_sync_active:
+            return
         self._apply_playback_cursor(t, source)
 
     def _report_scroll_sync_debug(self, source: str, t: float, y: int) -> None:
@@ -2541,121 +2866,71 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
 
+        if not path.lower().endswith(".srt"):
+            self._update_status("아직 JSON 불러오기는 지원하지 않습니다.")
+            return
+
+        # Parse off the GUI thread; only the newest request per side is applied
+        self._subtitle_load_seq[target] = self._subtitle_load_seq.get(target, 0) + 1
+        self._update_status("로딩 중...")
+        t = threading.Thread(
+            target=self._subtitle_parse_worker,
+            args=(target, path, self._subtitle_load_seq[target]),
+            daemon=True,
+        )
+        t.start()
+
+    def _subtitle_parse_worker(self, target: str, path: str, seq: int):
+        """Background worker to read and parse an SRT file."""
         try:
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
-
-            if path.lower().endswith(".srt"):
-                segments = SubtitleManager.parse_srt(content)
-            else:
-                self._update_status("아직 JSON 불러오기는 지원하지 않습니다.")
-                return
-
-            if target == "left":
-                self.live_editor._manager.clear()
-                for seg in segments:
-                    self.live_editor._manager.add_segment(seg)
-                self.live_editor.refresh()
-                self.waveform_left.refresh_segments(self._subtitle_manager.segments)
-                self._update_status(f"좌측 자막 불러옴: {path}")
-                return
-
-            # Right target
-            self.file_editor._manager.clear()
-            for seg in segments:
-                self.file_editor._manager.add_segment(seg)
-            self.file_editor.refresh()
-            self.waveform_right.refresh_segments(self._file_subtitle_manager.segments)
-            self._update_status(f"우측 자막 불러옴: {path}")
-
+            segments = SubtitleManager.parse_srt(content)
+            error = ""
         except Exception as e:
+            segments = []
+            error = str(e)
+        self.subtitle_file_parsed.emit(target, path, segments, error, seq)
+
+    def _on_subtitle_file_parsed(
+        self, target: str, path: str, segments: list, error: str, seq: int
+    ):
+        """Apply parsed subtitles on the GUI thread."""
+        if seq != self._subtitle_load_seq.get(target):
+            return  # superseded by a newer load
+        if error:
             QMessageBox.critical(
-                self, "오류", f"파일을 불러오는 중 오류가 발생했습니다:\n{e}"
+                self, "오류", f"파일을 불러오는 중 오류가 발생했습니다:\n{error}"
             )
+            return
+
+        if target == "left":
+            self.live_editor._manager.set_segments(segments)
+            self.live_editor.refresh()
+            self.waveform_left.refresh_segments(self._subtitle_manager.segments)
+            self._update_status(f"좌측 자막 불러옴: {path}")
+            return
+
+        # Right target
+        self.file_editor._manager.set_segments(segments)
+        self.file_editor.refresh()
+        self.waveform_right.refresh_segments(self._file_subtitle_manager.segments)
+        self._update_status(f"우측 자막 불러옴: {path}")
 
     def _apply_theme(self, theme: str | None = None):
         """Apply UI theme."""
         if theme is None:
-            settings = QSettings("ThinkSub", "ThinkSub2")
+            settings = self._settings
             theme = str(settings.value("ui_theme", "dark"))
 
-        app = QApplication.instance()
-        style = ""
-
-        if theme == "light":
-            style = """
-                QWidget { background-color: #f2f2ee; color: #1f2937; }
-                QDialog { background-color: #f2f2ee; }
-                QTabWidget::pane { border: 1px solid #e0e0da; }
-                QTabBar::tab { background: #e8e8e2; padding: 8px 12px; margin-right: 2px; }
-                QTabBar::tab:selected { background: #fbfbf7; border-bottom: 2px solid #3b82f6; }
-                QGroupBox { border: 1px solid #e0e0da; margin-top: 1.5em; font-weight: bold; }
-                QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
-                QLabel { color: #1f2937; }
-                QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #fbfbf7; border: 1px solid #d6d6cf; padding: 4px; border-radius: 4px; color: #1f2937; }
-                QTableView { background-color: #fbfbf7; gridline-color: #e0e0da; color: #1f2937; selection-background-color: #3b82f6; selection-color: white; }
-                QTableWidget::item { padding: 4px; }
-                QHeaderView::section { background-color: #e8e8e2; padding: 4px; border: 1px solid #d6d6cf; }
-                QScrollBar:vertical { background: #f2f2ee; width: 12px; margin: 0px; }
-                QScrollBar::handle:vertical { background: #d6d6cf; min-height: 20px; border-radius: 6px; }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-                QToolBar { background-color: #fbfbf7; border-bottom: 1px solid #e0e0da; padding: 4px; spacing: 4px; }
-                QPushButton { background-color: #e8e8e2; color: #1f2937; border: none; padding: 6px 12px; border-radius: 4px; }
-                QPushButton:hover { background-color: #d6d6cf; }
-                QPushButton:checked { background-color: #3b82f6; color: white; }
-                QStatusBar { background-color: #fbfbf7; color: #4b5563; border-top: 1px solid #e0e0da; }
-                QSplitter::handle { background-color: #d6d6cf; width: 2px; }
-            """
-        elif theme == "navy":
-            style = """
-                QWidget { background-color: #0a192f; color: #ccd6f6; }
-                QDialog { background-color: #0a192f; }
-                QTabWidget::pane { border: 1px solid #233554; }
-                QTabBar::tab { background: #112240; color: #8892b0; padding: 8px 12px; margin-right: 2px; }
-                QTabBar::tab:selected { background: #233554; color: #64ffda; border-bottom: 2px solid #64ffda; }
-                QGroupBox { border: 1px solid #233554; margin-top: 1.5em; font-weight: bold; color: #64ffda; }
-                QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
-                QLabel { color: #ccd6f6; }
-                QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #112240; border: 1px solid #233554; padding: 4px; border-radius: 4px; color: #ccd6f6; }
-                QTableView { background-color: #112240; gridline-color: #233554; color: #ccd6f6; selection-background-color: #233554; selection-color: #64ffda; }
-                QTableWidget::item { padding: 4px; }
-                QHeaderView::section { background-color: #0a192f; padding: 4px; border: 1px solid #233554; color: #8892b0; }
-                QScrollBar:vertical { background: #0a192f; width: 12px; margin: 0px; }
-                QScrollBar::handle:vertical { background: #233554; min-height: 20px; border-radius: 6px; }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-                QToolBar { background-color: #112240; border: none; padding: 4px; spacing: 4px; }
-                QPushButton { background-color: #233554; color: #ccd6f6; border: none; padding: 6px 12px; border-radius: 4px; }
-                QPushButton:hover { background-color: #303c55; }
-                QPushButton:checked { background-color: #64ffda; color: #0a192f; }
-                QStatusBar { background-color: #112240; color: #8892b0; }
-                QSplitter::handle { background-color: #233554; width: 2px; }
-            """
-        else:
-            # Dark (Default)
-            style = """
-                QWidget { background-color: #0f0f1a; color: #e5e7eb; }
-                QDialog { background-color: #0f0f1a; }
-                QTabWidget::pane { border: 1px solid #374151; }
-                QTabBar::tab { background: #1a1a2e; color: #9ca3af; padding: 8px 12px; margin-right: 2px; }
-                QTabBar::tab:selected { background: #374151; color: #e5e7eb; border-bottom: 2px solid #3b82f6; }
-                QGroupBox { border: 1px solid #374151; margin-top: 1.5em; font-weight: bold; color: #e5e7eb; }
-                QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; }
-                QLabel { color: #e5e7eb; }
-                QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox { background-color: #1a1a2e; border: 1px solid #374151; padding: 4px; border-radius: 4px; color: #e5e7eb; }
-                QTableView { background-color: #1a1a2e; gridline-color: #374151; color: #e5e7eb; selection-background-color: #374151; selection-color: #3b82f6; }
-                QTableWidget::item { padding: 4px; }
-                QHeaderView::section { background-color: #0f0f1a; padding: 4px; border: 1px solid #374151; color: #9ca3af; }
-                QScrollBar:vertical { background: #0f0f1a; width: 12px; margin: 0px; }
-                QScrollBar::handle:vertical { background: #374151; min-height: 20px; border-radius: 6px; }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-                QToolBar { background-color: #1a1a2e; border: none; padding: 4px; spacing: 4px; }
-                QPushButton { background-color: #374151; color: #e5e7eb; border: none; padding: 6px 12px; border-radius: 4px; }
-                QPushButton:hover { background-color: #4b5563; }
-                QPushButton:checked { background-color: #3b82f6; }
-                QStatusBar { background-color: #1a1a2e; color: #9ca3af; }
-                QSplitter::handle { background-color: #374151; width: 2px; }
-            """
+        # setStyleSheet repolishes every widget; skip it when nothing changed
+        if theme == self._current_theme:
+            return
+        self._current_theme = theme
+
+        style = _THEME_QSS.get(theme, _THEME_QSS["dark"])
 
+        app = QApplication.instance()
         if app:
             app.setStyleSheet(style)
         else:
@@ -2667,9 +2942,10 @@ class MainWindow(QMainWindow):
         if not self._status_timer.isActive():
             self._status_timer.start()
 
-    def _debug_log(self, message: str):
+    def _debug_log(self, message: str, *args):
+        # Args are formatted lazily by logging, so disabled debug costs nothing
         if getattr(self, "_scroll_sync_debug", False):
-            print(message)
+            self._logger.debug(message, *args)
 
     def _flush_status(self):
         if self._pending_status is not None:
@@ -2680,32 +2956,43 @@ class MainWindow(QMainWindow):
         """Update application state."""
         self._state = state
 
-        if state == AppState.IDLE:
-            self.btn_live.setText(i18n.tr("▶ Live 자막"))
-            self.btn_live.setChecked(False)
-            self._update_status(i18n.tr("준비"))
-        elif state == AppState.LOADING:
-            self.btn_live.setText(i18n.tr("⏹ 취소"))
-            self.btn_live.setEnabled(True)  # Allow cancellation
-            self.btn_live.setChecked(True)
-            self._update_status(i18n.tr("모델 로딩 중..."))
-        elif state == AppState.READY:
-            self.btn_live.setText(i18n.tr("⏹ 정지"))
-            self.btn_live.setEnabled(True)
-            self._update_status(i18n.tr("녹음 중"))
-        elif state == AppState.RECORDING:
-            self.btn_live.setText(i18n.tr("⏹ 정지"))
-            self._update_status(i18n.tr("Live 자막 진행 중..."))
+        if self._state_ui is None:
+            self._state_ui = self._build_state_ui()
+        text, checked, enabled, status = self._state_ui[state]
+        self.btn_live.setText(text)
+        if enabled is not None:
+            self.btn_live.setEnabled(enabled)  # LOADING: allow cancellation
+        if checked is not None:
+            self.btn_live.setChecked(checked)
+        self._update_status(status)
 
         # Live/STT mutual exclusion
         if hasattr(self, "_update_file_stt_ui"):
             self._update_file_stt_ui()
 
+    def _build_state_ui(self) -> dict:
+        """Translated (button text, checked, enabled, status) per state.
+
+        None leaves that button property untouched.
+        """
+        stop = i18n.tr("⏹ 정지")
+        return {
+            AppState.IDLE: (i18n.tr("▶ Live 자막"), False, None, i18n.tr("준비")),
+            AppState.LOADING: (
+                i18n.tr("⏹ 취소"),
+                True,
+                True,
+                i18n.tr("모델 로딩 중..."),
+            ),
+            AppState.READY: (stop, None, True, i18n.tr("녹음 중")),
+            AppState.RECORDING: (stop, None, None, i18n.tr("Live 자막 진행 중...")),
+        }
+
     @Slot()
     def _on_live_clicked(self):
         """Handle Live button click."""
         # Multi-function: If Playing, act as Stop
-        if self._is_waveform_playing():
+        if self._any_waveform_playing:
             if self._active_waveform:
                 self._active_waveform.stop_playback()
             return
@@ -2737,7 +3024,7 @@ class MainWindow(QMainWindow):
 
     def _get_transcriber_config(self, mode: str = "live") -> dict:
         """Centralized helper to gather transcriber configuration from settings."""
-        settings = QSettings("ThinkSub", "ThinkSub2")
+        settings = self._settings
         config = {
             "model": settings.value("model", "large-v3-turbo"),
             "device": settings.value("device", "cuda"),
@@ -2777,7 +3064,7 @@ class MainWindow(QMainWindow):
 
         # 3. Start transcriber process
         config = self._get_transcriber_config(mode="live")
-        settings = QSettings("ThinkSub", "ThinkSub2")
+        settings = self._settings
 
         # Log Model Params
         model_name = config["model"]
@@ -2825,88 +3112,93 @@ class MainWindow(QMainWindow):
             self._audio_recorder.stop()
 
         self._audio_recorder.set_device(mic_index)
+        self._current_mic_index = mic_index
 
         # DEBUG: Confirm Device Name
-        print(f"[Main] Restarting audio recorder with device index: {mic_index}")
-        try:
-            import sounddevice as sd
+        self._logger.debug(
+            "[Main] Restarting audio recorder with device index: %s", mic_index
+        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            try:
+                import sounddevice as sd
 
-            if mic_index is not None:
-                device_info = sd.query_devices(mic_index, "input")
-                if isinstance(device_info, dict) and "name" in device_info:
-                    print(f"[Main] Selected Device Name: {device_info['name']}")
+                if mic_index is not None:
+                    device_info = sd.query_devices(mic_index, "input")
+                    if isinstance(device_info, dict) and "name" in device_info:
+                        device_info = device_info["name"]
+                    self._logger.debug("[Main] Selected Device Name: %s", device_info)
                 else:
-                    print(f"[Main] Selected Device Name: {device_info}")
-            else:
-                print(f"[Main] Using Default Device")
-        except Exception as e:
-            print(f"[Main] Could not query device info: {e}")
+                    self._logger.debug("[Main] Using Default Device")
+            except Exception as e:
+                self._logger.debug("[Main] Could not query device info: %s", e)
 
         # VAD Reset is Critical for new session
         self._vad_processor.reset()
 
-        # Initialize audio collection for session recording
-        self._current_session_audio = []
+        # Stream session audio to a temporary WAV while recording
+        self._open_session_wav()
 
         self._audio_recorder.start()
 
         self._transcriber.start(config)
+        self._fw_push_key = None
         self._transcriber.load_model()
 
         # 4. Start polling for results and logs
-        self._result_timer.start(50)  # 50ms polling
-        self._log_timer.start(100)
+        self._result_timer.start(500)  # watchdog; results arrive via signal
+        self._log_timer.start(500)
+
+    def _open_session_wav(self) -> None:
+        """Open a temp WAV that live audio chunks are streamed into."""
+        self._close_session_wav()
+        # Never leave the previous recording's path behind: a failed open
+        # would otherwise make project save copy the old session's audio
+        with self._session_wav_lock:
+            self._current_session_wav_path = None
+        try:
+            temp_dir = os.path.join(os.getcwd(), "projects", "temp")
+            os.makedirs(temp_dir, exist_ok=True)
+            wav_path = os.path.join(
+                temp_dir, f"recording_{uuid.uuid4().hex[:8]}.wav"
+            )
+            wf = wave.open(wav_path, "wb")
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(AudioRecorder.MODEL_SAMPLE_RATE)
+        except Exception as e:
+            self._logger.error("[Main] Failed to open temporary WAV: %s", e)
+            if self._log_window:
+                self._log_window.append_log(f"[오디오] 임시 WAV 생성 실패: {e}")
+            return
+        with self._session_wav_lock:
+            self._session_wav = wf
+            self._current_session_wav_path = wav_path
+
+    def _close_session_wav(self) -> Optional[str]:
+        """Close the streamed session WAV; returns its path if it was open."""
+        with self._session_wav_lock:
+            wf = self._session_wav
+            self._session_wav = None
+            if wf is None:
+                return None
+            try:
+                wf.close()
+            except Exception as e:
+                print(f"[Main] Failed to save temporary WAV: {e}")
+                return None
+            return self._current_session_wav_path
 
     def _stop_live(self):
         """Stop Live transcription."""
         # Stop audio
         self._audio_recorder.stop()
 
-        # Save temporary WAV file from collected audio (in background)
-        self._current_session_wav_path = None
-        if self._current_session_audio:
-
-            def save_wav_background(audio_chunks, state_ref):
-                """Save WAV in background thread."""
-                try:
-                    from scipy.io import wavfile
-                    import uuid
-
-                    temp_dir = os.path.join(os.getcwd(), "projects", "temp")
-                    os.makedirs(temp_dir, exist_ok=True)
-
-                    temp_filename = f"recording_{uuid.uuid4().hex[:8]}.wav"
-                    wav_path = os.path.join(temp_dir, temp_filename)
-
-                    # Concatenate all audio chunks
-                    full_audio = np.concatenate(audio_chunks)
-                    # Convert float32 to int16 for WAV
-                    audio_int16 = (full_audio * 32767).astype(np.int16)
-                    wavfile.write(
-                        wav_path, AudioRecorder.MODEL_SAMPLE_RATE, audio_int16
-                    )
-
-                    # Set path back in main thread
-                    state_ref._current_session_wav_path = wav_path
-
-                    # Log in main thread
-                    QMetaObject.invokeMethod(
-                        state_ref,
-                        lambda: state_ref._log_window.append_log(
-                            f"임시 녹음 파일 저장: {temp_filename}"
-                        )
-                        if state_ref._log_window
-                        else None,
-                    )
-                except Exception as e:
-                    print(f"[Main] Failed to save temporary WAV: {e}")
-
-            # Start background save
-            audio_chunks = self._current_session_audio
-            self._current_session_audio = None  # Prevent double-save
-            threading.Thread(
-                target=save_wav_background, args=(audio_chunks, self), daemon=True
-            ).start()
+        # Finalize the streamed session WAV
+        wav_path = self._close_session_wav()
+        if wav_path and self._log_window:
+            self._log_window.append_log(
+                f"임시 녹음 파일 저장: {os.path.basename(wav_path)}"
+            )
 
         # Stop transcriber
         self._transcriber.shutdown()
@@ -2932,12 +3224,27 @@ class MainWindow(QMainWindow):
 
         self._set_state(AppState.IDLE)
 
+    @Slot()
+    def _on_transcriber_results_ready(self):
+        # Same gate as the old polling: results wait while the timer is stopped
+        if self._result_timer.isActive():
+            self._poll_results()
+
+    @Slot()
+    def _on_transcriber_logs_ready(self):
+        if self._log_timer.isActive():
+            self._poll_logs()
+
     @Slot()
     def _poll_results(self):
-        """Poll transcriber result queue."""
+        """Drain transcriber results staged by the relay thread."""
+        pending = self._transcriber.pending_results
+        self._transcriber.results_notified.clear()
+        items = []
+        while pending:
+            items.append(pending.popleft())
         try:
-            while not self._transcriber.result_queue.empty():
-                item = self._transcriber.result_queue.get_nowait()
+            for item in self._coalesce_result_batches(items):
                 if isinstance(item, tuple) and len(item) >= 2:
                     msg_type = item[0]
                     data = item[1]
@@ -3039,14 +3346,15 @@ class MainWindow(QMainWindow):
 
                 elif msg_type == "FILE_COMPLETED":
                     filename = data
+                    file_segments = self._file_subtitle_manager.segments
                     if self._log_window:
                         self._log_window.append_log(f"파일 변환 완료: {filename}")
                         self._log_window.append_log(
-                            f"[MediaView] File segments: {len(self._file_subtitle_manager.segments)}"
+                            f"[MediaView] File segments: {len(file_segments)}"
                         )
-                        if self._file_subtitle_manager.segments:
-                            first = self._file_subtitle_manager.segments[0]
-                            last = self._file_subtitle_manager.segments[-1]
+                        if file_segments:
+                            first = file_segments[0]
+                            last = file_segments[-1]
                             self._log_window.append_log(
                                 f"[MediaView] First: {first.start:.2f}-{first.end:.2f}"
                             )
@@ -3054,15 +3362,9 @@ class MainWindow(QMainWindow):
                                 f"[MediaView] Last: {last.start:.2f}-{last.end:.2f}"
                             )
                     self._update_media_srt_and_proxy()
-                    if (
-                        self._media_view
-                        and self._media_dock
-                        and self._media_dock.isVisible()
-                    ):
-                        if self._file_subtitle_manager.segments:
-                            start_time = float(
-                                self._file_subtitle_manager.segments[0].start
-                            )
+                    if self._media_view and self._media_visible:
+                        if file_segments:
+                            start_time = float(file_segments[0].start)
                         else:
                             start_time = 0.0
                         self._media_view.set_time(start_time)
@@ -3107,30 +3409,63 @@ class MainWindow(QMainWindow):
                     elif self._file_stt_running:
                         self._finish_file_stt(error=err)
 
-        except Exception as e:
-            print(f"Error polling results: {e}")
-            import traceback
+        except Exception:
+            self._logger.exception("Error polling results")
 
-            traceback.print_exc()
+    @staticmethod
+    def _coalesce_result_batches(items: list) -> list:
+        """Drop draft-only TRANSCRIPTION_BATCH messages already superseded.
+
+        Each live batch starts with delete_drafts(), so a batch holding only
+        drafts that is directly followed by another batch would be wiped
+        before the UI repaints. Batches with finals and all other messages
+        are kept in arrival order.
+        """
+        def _is_batch(item) -> bool:
+            return (
+                isinstance(item, tuple)
+                and len(item) >= 2
+                and item[0] == "TRANSCRIPTION_BATCH"
+                and isinstance(item[1], list)
+            )
+
+        kept: list = []
+        for i, item in enumerate(items):
+            if (
+                _is_batch(item)
+                and i + 1 < len(items)
+                and _is_batch(items[i + 1])
+                and not any(getattr(r, "is_final", True) for r in item[1])
+            ):
+                continue
+            kept.append(item)
+        return kept
 
     @Slot()
     def _poll_logs(self):
-        """Poll transcriber log queue."""
+        """Drain transcriber logs staged by the relay thread."""
+        pending = self._transcriber.pending_logs
+        self._transcriber.logs_notified.clear()
         try:
-            while not self._transcriber.log_queue.empty():
-                log_msg = self._transcriber.log_queue.get_nowait()
-                if self._log_window:
-                    self._log_window.append_log(log_msg)
-                if (
-                    self._batch_running
-                    and self._batch_dialog
-                    and self._batch_current_file
-                ):
-                    match = re.search(r"\[진행률\]\s+(\d+)%", log_msg)
+            messages = []
+            while pending:
+                messages.append(pending.popleft())
+            if not messages:
+                return
+            if self._log_window:
+                self._log_window.append_logs(messages)
+            if self._batch_running and self._batch_dialog and self._batch_current_file:
+                # Only the latest progress line in the batch matters
+                for log_msg in reversed(messages):
+                    # Cheap substring gate; the regex only runs on candidates
+                    if "진행률" not in log_msg:
+                        continue
+                    match = _PROGRESS_RE.search(log_msg)
                     if match:
                         self._batch_dialog.update_progress(
                             self._batch_current_file, int(match.group(1))
                         )
+                        break
         except:
             pass
 
@@ -3150,25 +3485,28 @@ class MainWindow(QMainWindow):
 
             # Separate Text for Overlays
             live_texts = []
+            overlay_entries = []
+
+            # Filter thresholds are fixed for the whole batch; read them once
+            enable_live_pp = getattr(self, "_enable_live_post_processing", True)
+            if enable_live_pp:
+                rms_threshold = self._rms_threshold
+                min_text_length = self._min_text_length
+                min_duration = self._min_duration
+                max_duration = float(getattr(self, "_max_duration", 0.0) or 0.0)
 
             for result in results:
                 # --- Post-Processing Filters ---
-                enable_live_pp = getattr(self, "_enable_live_post_processing", True)
                 if enable_live_pp:
-                    if (
-                        hasattr(result, "avg_rms")
-                        and result.avg_rms < self._rms_threshold
-                    ):
+                    if getattr(result, "avg_rms", rms_threshold) < rms_threshold:
                         continue
-                    if len(result.text) < self._min_text_length:
+                    if len(result.text) < min_text_length:
                         continue
                     # Duration Check
                     duration = result.end - result.start
-                    if duration < self._min_duration:
+                    if duration < min_duration:
                         continue
-                    if getattr(self, "_max_duration", 0.0) and duration >= float(
-                        self._max_duration
-                    ):
+                    if max_duration and duration >= max_duration:
                         continue
                 # -------------------------------
 
@@ -3178,12 +3516,10 @@ class MainWindow(QMainWindow):
                 )
 
                 for seg in segments:
-                    # Update Waveform
-                    self.waveform_left.add_segment_overlay(
-                        seg.id, seg.start, seg.end, seg.status == SegmentStatus.FINAL
-                    )
+                    is_final = seg.status == SegmentStatus.FINAL
+                    word_tuples = None
 
-                    if seg.status == SegmentStatus.FINAL:
+                    if is_final:
                         # Append to History Overlay (Top)
                         self.overlay.append_history(seg.text)
 
@@ -3192,11 +3528,18 @@ class MainWindow(QMainWindow):
                                 (w.start, w.end, w.text, w.probability)
                                 for w in seg.words
                             ]
-                            self.waveform_left.add_word_timestamps(seg.id, word_tuples)
                     else:
                         # Collect Draft Text
                         live_texts.append(seg.text)
 
+                    # Waveform overlays are applied together after the loop
+                    overlay_entries.append(
+                        (seg.id, seg.start, seg.end, is_final, word_tuples)
+                    )
+
+            # Update Waveform (single repaint for the whole batch)
+            self.waveform_left.add_segment_overlays(overlay_entries)
+
             # Update Live Overlay (Bottom) - Overwrite with current frame drafts
             if self.overlay.isVisible():
                 self.overlay.set_live_text(" ".join(live_texts))
@@ -3245,20 +3588,8 @@ class MainWindow(QMainWindow):
             # Check duplication/add
             # For File STT, we treat everything as 'FINAL' effectively if it came from Whisper's file mode
             # But the result.is_final should already be True
-            segments = self._add_single_result(
-                result, self._file_subtitle_manager, mode="file"
-            )
-
-            # Manually update overlays and word timestamps for File STT
-            for seg in segments:
-                self.waveform_right.add_segment_overlay(
-                    seg.id, seg.start, seg.end, seg.status == SegmentStatus.FINAL
-                )
-                if seg.words:
-                    word_tuples = [
-                        (w.start, w.end, w.text, w.probability) for w in seg.words
-                    ]
-                    self.waveform_right.add_word_timestamps(seg.id, word_tuples)
+            # Overlays are drawn once in step 4, after merging has settled ids
+            self._add_single_result(result, self._file_subtitle_manager, mode="file")
 
         # 3. Merge Short Segments (File Mode)
         settings = QSettings("ThinkSub", "ThinkSub2")
@@ -3471,8 +3802,7 @@ class MainWindow(QMainWindow):
         segments_to_add, updated_existing = self._merge_abbrev_segments(
             manager, segments, whitelist
         )
-        for seg in segments_to_add:
-            manager.add_segment(seg)
+        manager.add_segments(segments_to_add)
 
         return updated_existing + segments_to_add
 
@@ -3495,32 +3825,29 @@ class MainWindow(QMainWindow):
     ) -> None:
         if not segments:
             return
+        # Default settings: nothing to shift or pad. Transcriber times are
+        # already non-negative with end >= start, so the clamps are no-ops too.
+        if not (offset or pad_before or pad_after):
+            return
 
+        # Typically a handful of segments per result, so plain float math in
+        # one pass beats building arrays; words get offset + clamp together.
         for seg in segments:
-            if offset:
-                seg.start += offset
-                seg.end += offset
-                if seg.words:
-                    for w in seg.words:
-                        w.start += offset
-                        w.end += offset
-
-            if pad_before:
-                seg.start -= pad_before
-            if pad_after:
-                seg.end += pad_after
-
-            if seg.start < 0:
-                seg.start = 0.0
-            if seg.end < seg.start:
-                seg.end = seg.start
+            start = seg.start + offset - pad_before
+            end = seg.end + offset + pad_after
+            if start < 0:
+                start = 0.0
+            seg.start = start
+            seg.end = end if end >= start else start
 
             if seg.words:
                 for w in seg.words:
-                    if w.start < 0:
-                        w.start = 0.0
-                    if w.end < w.start:
-                        w.end = w.start
+                    ws = w.start + offset
+                    we = w.end + offset
+                    if ws < 0:
+                        ws = 0.0
+                    w.start = ws
+                    w.end = we if we >= ws else ws
 
     def _apply_stt_padding(
         self, segments: list[SubtitleSegment], pad_before: float, pad_after: float
@@ -3533,8 +3860,11 @@ class MainWindow(QMainWindow):
         if not segments:
             return
 
-        # Sort segments by start time
-        sorted_segments = sorted(segments, key=lambda s: s.start)
+        # Sort segments by start time (in place: callers pass a fresh list).
+        # Single segments (the common case) need no sort or gap pass.
+        if len(segments) > 1:
+            segments.sort(key=attrgetter("start"))
+        sorted_segments = segments
 
         for i in range(len(sorted_segments)):
             current_seg = sorted_segments[i]
@@ -3553,22 +3883,10 @@ class MainWindow(QMainWindow):
                 # If gap is negative (overlapping), move next segment to start after current
                 if gap < 0:
                     next_seg.start = current_seg.end
-                    # Adjust word timestamps for next segment
-                    if next_seg.words:
-                        time_offset = next_seg.start - sorted_segments[i + 1].start
-                        for w in next_seg.words:
-                            w.start += time_offset
-                            w.end += time_offset
 
                 # If gap is >= 0.5 seconds, adjust next segment start time
                 elif gap >= 0.5:
                     next_seg.start = current_seg.end + 0.5
-                    # Adjust word timestamps for next segment
-                    if next_seg.words:
-                        time_offset = next_seg.start - sorted_segments[i + 1].start
-                        for w in next_seg.words:
-                            w.start += time_offset
-                            w.end += time_offset
 
             # Ensure valid time bounds
             if current_seg.start < 0:
@@ -3584,9 +3902,9 @@ class MainWindow(QMainWindow):
                     if w.end < w.start:
                         w.end = w.start
 
-        # Re-save original start times for future reference
-        for seg in sorted_segments:
-            seg._original_start = seg.start
+            # Re-save original start time for future reference (final now:
+            # later iterations only move segments after this one)
+            current_seg._original_start = current_seg.start
 
     def _merge_abbrev_segments(
         self,
@@ -3597,7 +3915,7 @@ class MainWindow(QMainWindow):
         if not segments or not whitelist:
             return segments, []
 
-        normalized = set(self._normalize_abbrev_list(whitelist))
+        normalized = self._get_abbrev_set(whitelist)
         merged_segments: list[SubtitleSegment] = []
 
         for seg in segments:
@@ -3619,6 +3937,8 @@ class MainWindow(QMainWindow):
                 self._merge_segment_into(last_existing, first_new)
                 updated_existing.append(last_existing)
                 merged_segments = merged_segments[1:]
+                # End grew in place; add_segments() may get nothing to add
+                manager.mark_changed()
 
         return merged_segments, updated_existing
 
@@ -3643,14 +3963,18 @@ class MainWindow(QMainWindow):
             target.text = left
 
         target.end = max(target.end, source.end)
-        if target.words or source.words:
-            target.words = list(target.words or []) + list(source.words or [])
+        # One new list only when both sides have words; never alias source's
+        if source.words:
+            target.words = (
+                target.words + source.words if target.words else list(source.words)
+            )
 
     def _last_token(self, text: str) -> str:
-        tokens = (text or "").strip().split()
-        if not tokens:
+        text = (text or "").rstrip()
+        if not text:
             return ""
-        return tokens[-1].strip().lower()
+        # Only the tail is needed; split once from the right
+        return text.rsplit(None, 1)[-1].lower()
 
     def _process_transcription(self, result: TranscribeResult):
         """Process a SINGLE transcription result (Legacy/Fallback)."""
@@ -3669,15 +3993,29 @@ class MainWindow(QMainWindow):
     def _on_audio_chunk(self, chunk: AudioChunk):
         """Handle audio chunk from recorder."""
         try:
-            # Collect audio data for session recording
-            if (
-                self._state == AppState.RECORDING
-                and self._current_session_audio is not None
-            ):
-                data = chunk.data
-                if hasattr(data, "flatten"):
-                    data = data.flatten()
-                self._current_session_audio.append(data)
+            # 1-D view of the chunk, shared by the WAV writer and the waveform.
+            # AudioRecorder already hands over a private copy, so ravel (no
+            # copy for contiguous data) replaces the two flatten() copies.
+            data = chunk.data
+            if hasattr(data, "ravel"):
+                data = data.ravel()
+
+            # Stream audio data to the session WAV
+            if self._state == AppState.RECORDING and self._session_wav is not None:
+                n = len(data)
+                if self._session_pcm_buf is None or len(self._session_pcm_buf) < n:
+                    self._session_pcm_buf = np.empty(n, dtype=np.int16)
+                    self._session_pcm_scratch = np.empty(n, dtype=np.float32)
+                pcm = _chunks_to_int16(
+                    (data,),
+                    out=self._session_pcm_buf[:n],
+                    scratch=self._session_pcm_scratch,
+                )
+                with self._session_wav_lock:
+                    if self._session_wav is not None:
+                        # writeframes keeps the header sizes valid while recording;
+                        # it takes the int16 array via the buffer protocol
+                        self._session_wav.writeframes(pcm)
 
             # Update waveform only if RECORDING (Model is Ready)
             if self._state == AppState.RECORDING:
@@ -3685,12 +4023,6 @@ class MainWindow(QMainWindow):
                 # chunk.start_time is ALREADY 0-based relative to Record Start
                 rel_time = chunk.start_time
 
-                # Ensure 1D
-                data = chunk.data
-                if hasattr(data, "flatten"):
-                    data = data.flatten()
-
-                # print(f"[Main] Sending {len(data)} samples to waveform. RelTime: {rel_time:.2f}")
                 self.waveform_left.update_audio(data, rel_time)
 
             # Skip VAD if not recording
@@ -3710,16 +4042,16 @@ class MainWindow(QMainWindow):
                 rel_start = start_time
                 rel_end = end_time
 
-                print(
-                    f"[Main-Debug] Final Phrase: AbsStart={start_time:.3f} -> RelStart={rel_start:.3f}"
+                self._logger.debug(
+                    "Final Phrase: AbsStart=%.3f -> RelStart=%.3f", start_time, rel_start
                 )
 
                 # --- Virtual Silence Chunk ---
                 if not self._first_speech_detected:
                     self._first_speech_detected = True
                     if rel_start > 0.1:  # Threshold (100ms)
-                        print(
-                            f"[Main] Creating Virtual Silence Chunk (0.0 - {rel_start:.2f})"
+                        self._logger.debug(
+                            "Creating Virtual Silence Chunk (0.0 - %.2f)", rel_start
                         )
                         silence_seg = SubtitleSegment(
                             start=0.0,
@@ -3739,9 +4071,9 @@ class MainWindow(QMainWindow):
                     current_time - self._last_live_update_time
                     >= self._live_update_interval
                 ):
-                    partial = self._vad_processor.get_current_phrase()
-                    if partial:
-                        audio_data, start_time, end_time = partial
+                    phrase = self._vad_processor.get_current_phrase()
+                    if phrase:
+                        audio_data, start_time, end_time = phrase
 
                         # Apply Anchor Offset
                         # REMOVED: Anchor logic. Use VAD timestamps directly.
@@ -3762,7 +4094,7 @@ class MainWindow(QMainWindow):
 
     def _on_waveform_split(self, segment_id: str, split_time: float):
         """Handle split request from waveform."""
-        if self._is_waveform_playing():
+        if self._any_waveform_playing:
             self._update_status("재생 중에는 분할할 수 없습니다.")
             return
         sender = self.sender()
@@ -3962,9 +4294,9 @@ class MainWindow(QMainWindow):
 
     def _check_ffmpeg(self) -> bool:
         """Check if ffmpeg is available."""
-        import shutil
-
-        if shutil.which("ffmpeg") is None:
+        if self._ffmpeg_path is None:
+            self._ffmpeg_path = shutil.which("ffmpeg")
+        if self._ffmpeg_path is None:
             QMessageBox.warning(
                 self,
                 "FFmpeg 없음",
@@ -3988,6 +4320,9 @@ class MainWindow(QMainWindow):
             self._open_media_path(path)
 
     def _open_media_path(self, path: str, load_sidecar: bool = True):
+        # A new media file supersedes any right-side subtitle load in flight,
+        # even when it has no sidecar of its own
+        self._subtitle_load_seq["right"] = self._subtitle_load_seq.get("right", 0) + 1
         self._selected_media_file = path
         self._update_status(f"미디어 선택됨: {path}")
         self._load_audio_background(path)
@@ -4030,14 +4365,74 @@ class MainWindow(QMainWindow):
 
     def _load_srt_file(self, srt_path: str) -> None:
         """Load an SRT file and display in the editor."""
-        if not os.path.exists(srt_path):
+        try:
+            st = os.stat(srt_path)
+        except OSError:
             return
-        segments = self._parse_srt_file(srt_path)
-        if not segments:
+        # Parse off the GUI thread; shares the right-side load sequence so a
+        # later manual import (or another media file) supersedes this one
+        self._subtitle_load_seq["right"] = self._subtitle_load_seq.get("right", 0) + 1
+        seq = self._subtitle_load_seq["right"]
+        # Edits made while the parse runs must not be overwritten by it
+        self._sidecar_load_state = self._right_manager_state()
+
+        key = (srt_path, st.st_size, st.st_mtime_ns)
+        cached = self._srt_cache.get(key)
+        if cached is not None:
+            # Unchanged file: rebuild fresh segments (the editor mutates them)
+            self._srt_cache.move_to_end(key)
+            segments = [
+                SubtitleSegment(
+                    start=start, end=end, text=text, status=SegmentStatus.FINAL
+                )
+                for start, end, text in cached
+            ]
+            self._on_sidecar_srt_parsed(srt_path, None, segments, seq)
             return
-        self._file_subtitle_manager.clear()
-        for seg in segments:
-            self._file_subtitle_manager.add_segment(seg)
+
+        t = threading.Thread(
+            target=self._sidecar_srt_worker,
+            args=(srt_path, key, seq),
+            daemon=True,
+        )
+        t.start()
+
+    def _right_manager_state(self) -> tuple:
+        mgr = self._file_subtitle_manager
+        return (mgr.segments, len(mgr.segments), mgr.version)
+
+    def _right_manager_unchanged(self, state: Optional[tuple]) -> bool:
+        if state is None:
+            return False
+        segments, count, version = state
+        mgr = self._file_subtitle_manager
+        return (
+            mgr.segments is segments
+            and len(segments) == count
+            and mgr.version == version
+        )
+
+    def _sidecar_srt_worker(self, srt_path: str, key: tuple, seq: int):
+        """Background worker to parse a sidecar SRT file."""
+        segments = list(self._iter_srt_file(srt_path))
+        self.sidecar_srt_parsed.emit(srt_path, key, segments, seq)
+
+    def _on_sidecar_srt_parsed(
+        self, srt_path: str, key: Optional[tuple], segments: list, seq: int
+    ):
+        """Apply a parsed sidecar SRT on the GUI thread."""
+        if key is not None and segments:
+            self._srt_cache[key] = tuple((s.start, s.end, s.text) for s in segments)
+            if len(self._srt_cache) > 8:
+                self._srt_cache.popitem(last=False)
+        if seq != self._subtitle_load_seq.get("right"):
+            return  # superseded by a newer load
+        if not segments or self._file_stt_running:
+            return
+        if not self._right_manager_unchanged(self._sidecar_load_state):
+            return  # edited since the load started
+        # One sort for the whole file instead of one per added segment
+        self._file_subtitle_manager.set_segments(segments)
         self.waveform_right.refresh_segments(self._file_subtitle_manager.segments)
         self.file_editor.refresh()
         self._update_status(f"자막 불러옴: {srt_path}")
@@ -4079,6 +4474,8 @@ class MainWindow(QMainWindow):
 
     def _run_batch_stt(self):
         if not self._batch_dialog:
+            from src.gui.batch_stt_dialog import BatchSttDialog
+
             self._batch_dialog = BatchSttDialog(self)
             self._batch_dialog.start_requested.connect(self._start_batch_stt)
             self._batch_dialog.stop_requested.connect(self._stop_batch_stt)
@@ -4201,6 +4598,12 @@ class MainWindow(QMainWindow):
             if self._log_window:
                 self._log_window.append_log(f"SRT 저장 실패: {e}")
 
+    def _on_media_dock_visibility_changed(self, visible: bool):
+        self._media_visible = bool(visible)
+        self._media_sync_last_push = -1.0
+        if self._media_view:
+            self._media_view._layout_subtitles()
+
     def _open_media_view(self):
         """Toggle MediaView dock widget."""
         # Check if dock exists, create if not
@@ -4229,9 +4632,7 @@ class MainWindow(QMainWindow):
                 else None
             )
             self._media_dock.visibilityChanged.connect(
-                lambda _: self._media_view._layout_subtitles()
-                if self._media_view
-                else None
+                self._on_media_dock_visibility_changed
             )
             self._media_dock.installEventFilter(self)
             self._media_view = MediaView(self._media_dock)
@@ -4273,10 +4674,16 @@ class MainWindow(QMainWindow):
         """Push settings to media view."""
         if not self._media_view:
             return
-        settings = QSettings("ThinkSub", "ThinkSub2")
+        if self._media_style_cache is None:
+            settings = self._settings
+            self._media_style_cache = (
+                int(settings.value("subtitle_font_size", 25)),
+                float(settings.value("subtitle_opacity", 80)) / 100.0,
+            )
+        font_size, opacity = self._media_style_cache
         self._media_view.update_style(
-            font_size=int(settings.value("subtitle_font_size", 25)),
-            opacity=float(settings.value("subtitle_opacity", 80)) / 100.0,
+            font_size=font_size,
+            opacity=opacity,
             bg_color="0, 0, 0",  # Default black for now
         )
 
@@ -4305,15 +4712,23 @@ class MainWindow(QMainWindow):
                 mime = event.mimeData()
                 if not mime:
                     return True
-                files = [u.toLocalFile() for u in mime.urls() if u.isLocalFile()]
-                media_exts = (".mp3", ".wav", ".m4a", ".mp4", ".mkv", ".flac", ".aac")
-                media_files = [f for f in files if f.lower().endswith(media_exts)]
-                srt_files = [f for f in files if f.lower().endswith(".srt")]
-                if media_files:
-                    self._open_media_path(media_files[0])
+                # One pass: the first media file wins, else the first SRT
+                media_file = srt_file = None
+                for u in mime.urls():
+                    if not u.isLocalFile():
+                        continue
+                    f = u.toLocalFile()
+                    ext = os.path.splitext(f)[1].lower()
+                    if ext in _MEDIA_EXTS:
+                        media_file = f
+                        break
+                    if srt_file is None and ext == ".srt":
+                        srt_file = f
+                if media_file:
+                    self._open_media_path(media_file)
                     event.acceptProposedAction()
-                elif srt_files:
-                    self._load_subtitle_file(target="right", path=srt_files[0])
+                elif srt_file:
+                    self._load_subtitle_file(target="right", path=srt_file)
                     event.acceptProposedAction()
                 else:
                     event.ignore()
@@ -4344,12 +4759,7 @@ class MainWindow(QMainWindow):
         We only use this for logging/debugging, not for cursor sync.
         """
         # Logging only - do NOT sync to waveform to prevent cursor shaking
-        if (
-            not self._media_debug_logged
-            and self._media_dock
-            and self._media_dock.isVisible()
-            and self._log_window
-        ):
+        if not self._media_debug_logged and self._media_visible and self._log_window:
             right_text = self._pick_text_at_time(self._file_subtitle_manager, t)
             left_text = self._pick_text_at_time(self._subtitle_manager, t)
             self._log_window.append_log(
@@ -4358,13 +4768,11 @@ class MainWindow(QMainWindow):
             self._media_debug_logged = True
 
     def _sync_media_time_from_waveform(self):
-        if (
-            not self._media_view
-            or not self._media_dock
-            or not self._media_dock.isVisible()
-        ):
+        if not self._media_view or not self._media_visible:
             return
         try:
+            from PySide6.QtMultimedia import QMediaPlayer
+
             if (
                 self._media_view.player().playbackState()
                 == QMediaPlayer.PlaybackState.PlayingState
@@ -4379,12 +4787,15 @@ class MainWindow(QMainWindow):
                 cursor = first_start
         if cursor < 0:
             return
+        if abs(cursor - self._media_sync_last_push) < self._media_sync_min_delta:
+            return
+        self._media_sync_last_push = cursor
         self._media_view.set_time(cursor)
+        now = time.monotonic()
         if self._log_window and (
-            self._media_sync_debug_last < 0
-            or abs(cursor - self._media_sync_debug_last) >= 1.0
+            self._media_sync_debug_last < 0 or now - self._media_sync_debug_last >= 1.0
         ):
-            self._media_sync_debug_last = cursor
+            self._media_sync_debug_last = now
             self._log_window.append_log(
                 f"[MediaSync] cursor={cursor:.2f} segs={len(self._file_subtitle_manager.segments)}"
             )
@@ -4430,6 +4841,7 @@ class MainWindow(QMainWindow):
     def _on_playback_started(self):
         """Handle playback start (Waveform driven)."""
         self._playback_active = True
+        self._any_waveform_playing = True
 
         # Determine which waveform started
         sender = self.sender()
@@ -4437,15 +4849,9 @@ class MainWindow(QMainWindow):
             self._active_waveform = self.waveform_left
             # Sync Editor Icon
             t = self.waveform_left.cursor_time
-            # Find segment at t
-            # Basic linear search for now or use editor's knowledge
-            # Actually, usually playback starts FROM a segment or at cursor.
-            # Let's find seg in manager
-            found_id = None
-            for seg in self._subtitle_manager.segments:
-                if seg.start <= t <= seg.end:
-                    found_id = seg.id
-                    break
+            # Find segment at t (bisect on the manager's sorted start index)
+            seg = self._subtitle_manager.find_segment_at(t)
+            found_id = seg.id if seg is not None else None
 
             if found_id:
                 self.live_editor.update_playback_status(found_id, True)
@@ -4457,11 +4863,8 @@ class MainWindow(QMainWindow):
             self._active_waveform = self.waveform_right
             # Sync Editor Icon
             t = self.waveform_right.cursor_time
-            found_id = None
-            for seg in self._file_subtitle_manager.segments:
-                if seg.start <= t <= seg.end:
-                    found_id = seg.id
-                    break
+            seg = self._file_subtitle_manager.find_segment_at(t)
+            found_id = seg.id if seg is not None else None
 
             if found_id:
                 self.file_editor.update_playback_status(found_id, True)
@@ -4470,7 +4873,7 @@ class MainWindow(QMainWindow):
                     self._popup_editor.update_playback_indicator(found_id)
 
             # Sync MediaView
-            if self._media_view and self._media_dock and self._media_dock.isVisible():
+            if self._media_view and self._media_visible:
                 if self._selected_media_file:
                     self._media_view.set_media(self._selected_media_file)
                 cursor = self.waveform_right.get_playback_time()
@@ -4499,6 +4902,7 @@ class MainWindow(QMainWindow):
             self._media_sync_timer.stop()
 
         self._playback_active = False
+        self._any_waveform_playing = self._is_waveform_playing()
 
         self.live_editor.set_playback_state(None, PlaybackState.IDLE)
         self.file_editor.set_playback_state(None, PlaybackState.IDLE)
@@ -4522,6 +4926,11 @@ class MainWindow(QMainWindow):
         """Load audio for waveform in background."""
         if not path:
             return
+        # Every media switch goes through here: release the previous file's
+        # full-length export decode instead of pinning it for the session
+        cached = self._decoded_audio_cache
+        if cached is not None and cached[0][0] != os.path.abspath(path):
+            self._decoded_audio_cache = None
         self._show_waveform_loading()
         t = threading.Thread(target=self._ffmpeg_worker, args=(path,), daemon=True)
         t.start()
@@ -4529,13 +4938,8 @@ class MainWindow(QMainWindow):
     def _ffmpeg_worker(self, path: str):
         """Background worker to extract audio using ffmpeg."""
         try:
-            # Increase buffer size for large files
-            # ffmpeg pipe output can be large.
-            # Using communicate() is safer than run() for large outputs as it handles buffering.
-            # However, subprocess.run with capture_output=True also uses communicate internally.
-
             cmd = [
-                "ffmpeg",
+                self._ffmpeg_path or "ffmpeg",
                 "-i",
                 path,
                 "-f",
@@ -4551,24 +4955,22 @@ class MainWindow(QMainWindow):
                 "pipe:1",
             ]
 
-            # Use Popen to stream or ensure no buffer limit hit (though memory is the limit)
-            # run() reads all into memory. If file is huge, this might crash.
-            # For now, assuming typical files fit in RAM (1 hour @ 16k float32 ~ 230MB).
-            # If "only tail visible" issue occurs, it might be due to pipe buffer overflow if not read properly,
-            # but run() handles that.
-            # CHECK: WaveformWidget might be auto-scrolling or scaling wrong.
-            # Let's ensure we read everything.
-
-            # Increase max buffer size if needed? No, run() handles it.
-
-            proc = subprocess.run(cmd, capture_output=True)
+            duration = self._probe_media_duration(path)
+            try:
+                src_size = os.path.getsize(path)
+            except OSError:
+                src_size = 0
+            if duration <= 0 and src_size > 500 * 1024 * 1024:
+                # No size estimate for a very large source: let ffmpeg write to
+                # disk and read the exact size back instead of regrowing buffers
+                returncode, data, err = self._decode_pcm_via_tempfile(cmd)
+            else:
+                returncode, data, err = self._decode_pcm_via_pipe(cmd, duration)
 
-            if proc.returncode == 0:
-                data = np.frombuffer(proc.stdout, dtype=np.float32)
+            if returncode == 0:
                 # print(f"[Debug] Audio loaded: {len(data)} samples")
                 self.waveform_audio_loaded.emit(data)
             else:
-                err = proc.stderr.decode(errors="ignore")
                 print(f"FFmpeg error: {err}")
                 QTimer.singleShot(
                     0,
@@ -4582,6 +4984,137 @@ class MainWindow(QMainWindow):
             print(f"Audio load error: {e}")
             QTimer.singleShot(0, self._hide_waveform_loading)
 
+    def _decode_pcm_via_pipe(
+        self, cmd: list[str], duration: float, dtype=np.float32
+    ) -> tuple:
+        """Run ffmpeg and read raw PCM stdout into a preallocated buffer.
+
+        ``dtype`` must match the ffmpeg output format (f32le / s16le).
+        Returns (returncode, samples, stderr_text).
+        """
+        # Stream PCM straight into a buffer sized from the probed duration,
+        # instead of collecting one large bytes object and copying it again.
+        # The buffer grows if the probe undershoots.
+        capacity = int((duration + 1.0) * 16000) if duration > 0 else 16000 * 60
+        capacity = max(capacity, 16000)
+        buf = np.empty(capacity, dtype=dtype)
+        filled = 0  # bytes
+
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0
+        )
+        stderr_chunks: list[bytes] = []
+        # Drain stderr separately so a chatty ffmpeg cannot block on a full pipe
+        err_thread = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()),
+            daemon=True,
+        )
+        err_thread.start()
+
+        chunk = 1 << 20
+        stdout = proc.stdout
+        while True:
+            if filled >= buf.nbytes:
+                grown = np.empty(buf.size * 2, dtype=dtype)
+                grown[: buf.size] = buf
+                buf = grown
+            view = memoryview(buf.view(np.uint8))[filled : filled + chunk]
+            n = stdout.readinto(view)
+            if not n:
+                break
+            filled += n
+        stdout.close()
+        proc.wait()
+        err_thread.join(timeout=5)
+
+        data = buf[: filled // buf.itemsize]
+        # The buffer only outgrows the audio by more than the probe padding
+        # after a failed probe; don't keep that slack alive
+        if buf.size - data.size > 16000 * 5:
+            data = data.copy()
+        err = b"".join(stderr_chunks).decode(errors="ignore")
+        return proc.returncode, data, err
+
+    def _decode_pcm_via_tempfile(self, cmd: list[str]) -> tuple:
+        """Run ffmpeg into a temp .pcm file and load it with np.fromfile.
+
+        Returns (returncode, samples, stderr_text).
+        """
+        fd, pcm_path = tempfile.mkstemp(suffix=".pcm")
+        os.close(fd)
+        try:
+            file_cmd = cmd[:-1] + ["-y", pcm_path]
+            proc = subprocess.run(file_cmd, capture_output=True)
+            if proc.returncode != 0:
+                return proc.returncode, None, proc.stderr.decode(errors="ignore")
+            return 0, np.fromfile(pcm_path, dtype=np.float32), ""
+        finally:
+            try:
+                os.remove(pcm_path)
+            except OSError:
+                pass
+
+    def _probe_media_duration(self, path: str) -> float:
+        """Return media duration in seconds via ffprobe, or 0.0 if unknown."""
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            path,
+        ]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            return max(0.0, float(proc.stdout.strip()))
+        except (OSError, ValueError, subprocess.SubprocessError):
+            return 0.0
+
+    def _decode_full_audio(self, path: str) -> Optional[np.ndarray]:
+        """Decode a whole media file to int16 mono 16 kHz, or None on failure.
+
+        The last result is kept per (path, mtime) so repeated exports of the
+        same file skip the decode.
+        """
+        try:
+            key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return None
+        cached = self._decoded_audio_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        cmd = [
+            self._ffmpeg_path or "ffmpeg",
+            "-i",
+            path,
+            "-f",
+            "s16le",
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-vn",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "pipe:1",
+        ]
+        try:
+            returncode, data, err = self._decode_pcm_via_pipe(
+                cmd, self._probe_media_duration(path), dtype=np.int16
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if returncode != 0 or data is None or data.size == 0:
+            if err:
+                print(f"FFmpeg error: {err}")
+            return None
+        self._decoded_audio_cache = (key, data)
+        return data
+
     def _show_waveform_loading(self) -> None:
         if self._waveform_load_dialog and self._waveform_load_dialog.isVisible():
             return
@@ -4605,22 +5138,22 @@ class MainWindow(QMainWindow):
             self._waveform_load_dialog = None
 
     def _get_media_proxy_path(self, src_path: str, srt_path: Optional[str]) -> str:
-        base = os.path.abspath(src_path)
+        # The mtimes are the cache key (the media SRT is rewritten on edits),
+        # so they are always re-read; path resolution and mkdir are not
+        base = self._media_abspath(src_path)
         try:
             mtime = os.path.getmtime(base)
         except OSError:
             mtime = 0
         srt_mtime = 0
-        if srt_path and os.path.exists(srt_path):
+        if srt_path:
             try:
                 srt_mtime = os.path.getmtime(srt_path)
             except OSError:
                 srt_mtime = 0
         key = f"{base}|{mtime}|{srt_mtime}".encode("utf-8")
-        digest = hashlib.md5(key).hexdigest()
-        proxy_dir = os.path.join(tempfile.gettempdir(), "thinksub_proxy")
-        os.makedirs(proxy_dir, exist_ok=True)
-        return os.path.join(proxy_dir, f"proxy_{digest}_360p.mp4")
+        digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+        return os.path.join(self._get_proxy_dir(), f"proxy_{digest}_360p.mp4")
 
     def _ensure_media_proxy_async(
         self, src_path: str, srt_path: Optional[str] = None
@@ -4642,58 +5175,75 @@ class MainWindow(QMainWindow):
                 f"[MediaProxy] Build start: {proxy_path} | srt={srt_note}"
             )
 
-        def _worker(proxy_path: str, srt_path: Optional[str]):
+        self._media_proxy_jobs.put((src_path, proxy_path, srt_path, task_key))
+        return None
+
+    def _media_proxy_worker_loop(self):
+        """Background worker that encodes queued preview proxies in order."""
+        while True:
+            src_path, proxy_path, srt_path, task_key = self._media_proxy_jobs.get()
             try:
-                temp_path = f"{proxy_path}.tmp"
-                vf = "scale=-2:360"
-                if srt_path and os.path.exists(srt_path):
-                    escaped = self._ffmpeg_escape_filter_path(srt_path)
-                    vf = f"subtitles='{escaped}',{vf}"
-                cmd = [
-                    "ffmpeg",
-                    "-y",
-                    "-hwaccel",
-                    "none",
-                    "-i",
-                    src_path,
-                    "-vf",
-                    vf,
-                    "-c:v",
-                    "libx264",
-                    "-preset",
-                    "veryfast",
-                    "-crf",
-                    "32",
-                    "-an",
-                    "-movflags",
-                    "+faststart",
-                    temp_path,
-                ]
-                proc = subprocess.run(cmd, capture_output=True)
-                if proc.returncode == 0 and os.path.exists(temp_path):
-                    os.replace(temp_path, proxy_path)
-                else:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                    err = proc.stderr.decode(errors="ignore") if proc else ""
-                    QTimer.singleShot(
-                        0,
-                        lambda: (
-                            self._log_window.append_log(
-                                f"[MediaProxy] FFmpeg error: {err.strip()}"
-                            )
-                            if self._log_window
-                            else None
-                        ),
-                    )
+                self._build_media_proxy(src_path, proxy_path, srt_path)
+            except Exception as e:
+                print(f"Media proxy error: {e}")
             finally:
                 self._media_proxy_tasks.discard(task_key)
                 if os.path.exists(proxy_path):
                     self.media_proxy_ready.emit(src_path, proxy_path)
 
-        t = threading.Thread(target=_worker, args=(proxy_path, srt_path), daemon=True)
-        t.start()
-        return None
+    def _build_media_proxy(
+        self, src_path: str, proxy_path: str, srt_path: Optional[str]
+    ) -> None:
+        temp_path = f"{proxy_path}.tmp"
+        vf = "scale=-2:360"
+        if srt_path and os.path.exists(srt_path):
+            escaped = self._ffmpeg_escape_filter_path(srt_path)
+            vf = f"subtitles='{escaped}',{vf}"
+        cmd = [
+            self._ffmpeg_path or "ffmpeg",
+            "-y",
+            "-hwaccel",
+            "auto",
+            "-i",
+            src_path,
+            "-vf",
+            vf,
+            "-c:v",
+            "libx264",
+            "-threads",
+            "0",
+            "-preset",
+            "veryfast",
+            "-tune",
+            "fastdecode",
+            "-crf",
+            "32",
+            "-an",
+            "-movflags",
+            "+faststart",
+            temp_path,
+        ]
+        proc = subprocess.run(cmd, capture_output=True)
+        if proc.returncode != 0:
+            # Some drivers fail hardware decode mid-stream; retry in software
+            cmd[cmd.index("-hwaccel") + 1] = "none"
+            proc = subprocess.run(cmd, capture_output=True)
+        if proc.returncode == 0 and os.path.exists(temp_path):
+            os.replace(temp_path, proxy_path)
+        else:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            err = proc.stderr.decode(errors="ignore") if proc else ""
+            QTimer.singleShot(
+                0,
+                lambda: (
+                    self._log_window.append_log(
+                        f"[MediaProxy] FFmpeg error: {err.strip()}"
+                    )
+                    if self._log_window
+                    else None
+                ),
+            )
 
     def _on_media_proxy_ready(self, src_path: str, proxy_path: str):
         if not self._media_view or not self._media_dock:
@@ -4788,8 +5338,6 @@ class MainWindow(QMainWindow):
 
     def _export_metadata(self, target: str = "left"):
         """Export metadata as JSON."""
-        import json
-
         path, _ = QFileDialog.getSaveFileName(
             self, "메타데이터 저장", "", "JSON Files (*.json)"
         )
@@ -4801,7 +5349,7 @@ class MainWindow(QMainWindow):
             )
             metadata = manager.export_metadata()
             with open(path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+                f.write(json.dumps(metadata, ensure_ascii=False, indent=2))
             self._update_status(f"메타데이터 저장됨: {path}")
 
     def _import_subtitle_choose_side(self, target: str):
@@ -4818,20 +5366,15 @@ class MainWindow(QMainWindow):
 
     def _export_lora_data_left(self):
         """Export LoRA training data from LEFT (>= 3s segments) to ./whisper_lora_data."""
-        from pathlib import Path
-        import json
-        import wave
-        import numpy as np
-
         out_dir = Path.cwd() / "whisper_lora_data"
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        # Filter segments from left editor manager
+        # Filter segments from left editor manager; keep (segment, stripped text)
         segments = [
-            s
+            (s, text)
             for s in self._subtitle_manager.segments
             if (not getattr(s, "is_hidden", False))
-            and (s.text or "").strip()
+            and (text := (s.text or "").strip())
             and (s.end - s.start) >= 3.0
         ]
 
@@ -4845,18 +5388,26 @@ class MainWindow(QMainWindow):
 
         manifest = []
 
+        # One directory listing instead of two stat() calls per candidate
+        taken = {
+            p.stem for p in out_dir.iterdir() if p.suffix in (".wav", ".txt")
+        }
+
         def _unique_base(base: str) -> str:
             # Avoid overwriting
             candidate = base
             n = 1
-            while (out_dir / f"{candidate}.wav").exists() or (
-                out_dir / f"{candidate}.txt"
-            ).exists():
+            while candidate in taken:
                 candidate = f"{base}_{n}"
                 n += 1
+            taken.add(candidate)
             return candidate
 
-        for idx, seg in enumerate(segments, start=1):
+        # Conversion buffers reused across segments (grown on demand)
+        i16_buf = np.empty(0, dtype=np.int16)
+        f32_scratch = np.empty(0, dtype=np.float32)
+
+        for idx, (seg, text) in enumerate(segments, start=1):
             base = _unique_base(f"seg_{idx:04d}")
             wav_path = out_dir / f"{base}.wav"
             txt_path = out_dir / f"{base}.txt"
@@ -4865,22 +5416,22 @@ class MainWindow(QMainWindow):
             if audio is None or len(audio) == 0:
                 continue
 
-            # float32 [-1,1] -> int16
-            audio_i16 = (np.clip(audio, -1.0, 1.0) * 32767.0).astype(np.int16)
+            # float32 [-1,1] -> int16: scale and clip in place, one cast
+            n = len(audio)
+            if len(i16_buf) < n:
+                i16_buf = np.empty(n, dtype=np.int16)
+                f32_scratch = np.empty(n, dtype=np.float32)
+            audio_i16 = _chunks_to_int16([audio], out=i16_buf[:n], scratch=f32_scratch)
 
-            with wave.open(str(wav_path), "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(16000)
-                wf.writeframes(audio_i16.tobytes())
+            _write_pcm16_wav(wav_path, audio_i16)
 
             # Export text as single line (remove newlines)
-            txt_path.write_text(seg.text.strip().replace("\n", " "), encoding="utf-8")
+            txt_path.write_text(text.replace("\n", " "), encoding="utf-8")
 
             manifest.append(
                 {
                     "wav": str(wav_path.name),
-                    "text": seg.text.strip(),
+                    "text": text,
                     "start": float(seg.start),
                     "end": float(seg.end),
                 }
@@ -4898,10 +5449,6 @@ class MainWindow(QMainWindow):
         )
 
     def _export_lora_data_right(self):
-        from pathlib import Path
-        import json
-        import subprocess
-
         if not self._selected_media_file:
             QMessageBox.information(
                 self,
@@ -4912,10 +5459,10 @@ class MainWindow(QMainWindow):
 
         # Must have word timestamps
         segments = [
-            s
+            (s, text)
             for s in self._file_subtitle_manager.segments
             if (not getattr(s, "is_hidden", False))
-            and (s.text or "").strip()
+            and (text := (s.text or "").strip())
             and (s.end - s.start) >= 3.0
             and getattr(s, "words", None)
             and len(getattr(s, "words", [])) > 0
@@ -4934,37 +5481,29 @@ class MainWindow(QMainWindow):
 
         manifest = []
 
+        # One directory listing instead of two stat() calls per candidate
+        taken = {
+            p.stem for p in out_dir.iterdir() if p.suffix in (".wav", ".txt")
+        }
+
         def _unique_base(base: str) -> str:
+            # Avoid overwriting
             candidate = base
             n = 1
-            while (out_dir / f"{candidate}.wav").exists() or (
-                out_dir / f"{candidate}.txt"
-            ).exists():
+            while candidate in taken:
                 candidate = f"{base}_{n}"
                 n += 1
+            taken.add(candidate)
             return candidate
 
         ffmpeg_missing = False
         ffmpeg_failed = 0
 
-        for idx, seg in enumerate(segments, start=1):
-            base = _unique_base(f"seg_{idx:04d}")
-            wav_path = out_dir / f"{base}.wav"
-            txt_path = out_dir / f"{base}.txt"
+        def _range_args(seg) -> list[str]:
+            return ["-ss", f"{float(seg.start):.3f}", "-to", f"{float(seg.end):.3f}"]
 
-            # Extract audio via ffmpeg
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-ss",
-                f"{float(seg.start):.3f}",
-                "-to",
-                f"{float(seg.end):.3f}",
-                "-i",
-                self._selected_media_file,
+        def _wav_args(wav_path) -> list[str]:
+            return [
                 "-vn",
                 "-ac",
                 "1",
@@ -4974,28 +5513,114 @@ class MainWindow(QMainWindow):
                 "pcm_s16le",
                 str(wav_path),
             ]
+
+        def _run_ffmpeg(cmd: list[str]) -> None:
+            # Use CREATE_NO_WINDOW to hide CMD window
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            # ffmpeg is quiet at -loglevel error; only stderr is kept, for failures
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                startupinfo=startupinfo,
+            )
+
+        jobs = []
+        for idx, (seg, text) in enumerate(segments, start=1):
+            base = _unique_base(f"seg_{idx:04d}")
+            jobs.append(
+                (seg, text, out_dir / f"{base}.wav", out_dir / f"{base}.txt")
+            )
+
+        ffmpeg_head = [
+            self._ffmpeg_path or "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+        ]
+        def _extract_batch(batch) -> tuple[list, int, bool]:
+            """Cut one batch; returns (extracted_jobs, failed_count, missing)."""
+            cmd = ffmpeg_head + ["-i", self._selected_media_file]
+            for seg, _, wav_path, _ in batch:
+                cmd += _range_args(seg) + _wav_args(wav_path)
             try:
-                # Use CREATE_NO_WINDOW to hide CMD window
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                subprocess.run(cmd, check=True, capture_output=True, text=True, startupinfo=startupinfo)
+                _run_ffmpeg(cmd)
+                return list(batch), 0, False
             except FileNotFoundError:
-                ffmpeg_missing = True
-                break
-            except subprocess.CalledProcessError:
-                ffmpeg_failed += 1
-                continue
+                return [], 0, True
+            except subprocess.CalledProcessError as e:
+                print(f"FFmpeg error: {(e.stderr or b'').decode(errors='ignore')}")
             except Exception:
-                ffmpeg_failed += 1
-                continue
+                pass
 
+            # Batch failed: retry its segments one by one so one bad range
+            # does not cost the others
+            done, failed = [], 0
+            for job in batch:
+                seg, _, wav_path, _ = job
+                cmd = (
+                    ffmpeg_head
+                    + _range_args(seg)
+                    + ["-i", self._selected_media_file]
+                    + _wav_args(wav_path)
+                )
+                try:
+                    _run_ffmpeg(cmd)
+                except FileNotFoundError:
+                    return done, failed, True
+                except Exception:
+                    failed += 1
+                    continue
+                done.append(job)
+            return done, failed, False
+
+        extracted = []
+        # Decode the media once and cut every segment out of memory
+        audio = self._decode_full_audio(self._selected_media_file)
+        if audio is not None:
+            sr = 16000
+            for job in jobs:
+                seg, _, wav_path, _ = job
+                clip = audio[int(float(seg.start) * sr) : int(float(seg.end) * sr)]
+                if clip.size == 0:
+                    ffmpeg_failed += 1
+                    continue
+                try:
+                    _write_pcm16_wav(wav_path, clip, sr)
+                except OSError:
+                    ffmpeg_failed += 1
+                    continue
+                extracted.append(job)
+        else:
+            # Full decode failed: one ffmpeg per batch of segments. The input
+            # is demuxed and decoded once and fanned out to every output
+            # (output-side -ss/-to). Batches keep the command line under the
+            # Windows length limit and run concurrently (subprocess waits
+            # release the GIL).
+            from concurrent.futures import ThreadPoolExecutor
+
+            batch_size = 40
+            batches = [
+                jobs[b : b + batch_size] for b in range(0, len(jobs), batch_size)
+            ]
+            workers = max(1, min(len(batches), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for done, failed, missing in pool.map(_extract_batch, batches):
+                    extracted.extend(done)
+                    ffmpeg_failed += failed
+                    ffmpeg_missing = ffmpeg_missing or missing
+
+        for seg, text, wav_path, txt_path in extracted:
             # Export text as single line (remove newlines)
-            txt_path.write_text(seg.text.strip().replace("\n", " "), encoding="utf-8")
+            txt_path.write_text(text.replace("\n", " "), encoding="utf-8")
             manifest.append(
                 {
                     "wav": str(wav_path.name),
-                    "text": seg.text.strip(),
+                    "text": text,
                     "start": float(seg.start),
                     "end": float(seg.end),
                 }
@@ -5032,6 +5657,17 @@ class MainWindow(QMainWindow):
         if not raw or not isinstance(raw, str):
             return {}
 
+        # The string rarely changes between settings updates; reuse the
+        # last parse (callers get their own top-level dict)
+        cached_raw, cached = self._fw_extra_cache
+        if raw == cached_raw:
+            return dict(cached)
+        params = self._parse_extra_params_uncached(raw)
+        self._fw_extra_cache = (raw, params)
+        return dict(params)
+
+    def _parse_extra_params_uncached(self, raw: str) -> dict:
+        """Parse a non-empty extra params string (see _parse_extra_params)."""
         # Try JSON first (backward compatibility)
         if raw.strip().startswith("{"):
             try:
@@ -5087,6 +5723,12 @@ class MainWindow(QMainWindow):
         If a key exists in "추가 매개변수" JSON, that value overrides the value from the
         "매개변수" tab.
         """
+        # Settings only change through the dialog (_on_settings_changed clears
+        # this); hand out copies so callers can't alter the cached dict
+        cached = self._fw_params_cache.get(mode)
+        if cached is not None and settings is self._settings:
+            return copy.deepcopy(cached)
+
         prefix = f"fw_{mode}_"
 
         # Helper to get setting with fallback to legacy keys if needed
@@ -5154,13 +5796,11 @@ class MainWindow(QMainWindow):
         if vad_params:
             tab_params["vad_parameters"] = vad_params
 
-        extra_raw = settings.value("faster_whisper_params", "{}")
-        extra = self._parse_extra_params(extra_raw)
-
-        merged = dict(tab_params)
-        if isinstance(extra.get("vad_parameters"), dict):
-            merged.pop("vad_parameters", None)
-        merged.update(extra)
+        merged = self._merge_fw_extra_params(
+            tab_params, settings.value("faster_whisper_params", "{}")
+        )
+        if settings is self._settings:
+            self._fw_params_cache[mode] = copy.deepcopy(merged)
         return merged
 
     def _build_fw_params_from_dict(self, settings_dict: dict) -> dict:
@@ -5205,10 +5845,18 @@ class MainWindow(QMainWindow):
         except Exception:
             tab_params = {}
 
-        extra: dict = {}
-        raw = settings_dict.get("faster_whisper_params", "{}")
-        extra = self._parse_extra_params(raw)
+        return self._merge_fw_extra_params(
+            tab_params, settings_dict.get("faster_whisper_params", "{}")
+        )
+
+    def _merge_fw_extra_params(self, tab_params: dict, extra_raw: Any) -> dict:
+        """Overlay the user's extra params on the settings-tab params.
 
+        An extra ``vad_parameters`` dict replaces the tab one wholesale.
+        """
+        extra = self._parse_extra_params(extra_raw)
+        if not extra:
+            return dict(tab_params)
         merged = dict(tab_params)
         if isinstance(extra.get("vad_parameters"), dict):
             merged.pop("vad_parameters", None)
@@ -5217,16 +5865,12 @@ class MainWindow(QMainWindow):
 
     def _on_settings_changed(self, settings: dict):
         """Handle settings changes."""
+        self._fw_cfg_cache.clear()
+        self._fw_params_cache.clear()
+        self._media_style_cache = None
+
         # Update VAD parameters (Live)
-        should_update_vad = False
-        if "vad_threshold" in settings:
-            should_update_vad = True
-        if "vad_silence_duration" in settings:
-            should_update_vad = True
-        if "fw_live_vad_speech_pad_ms" in settings:
-            should_update_vad = True
-
-        if should_update_vad:
+        if not _VAD_SETTING_KEYS.isdisjoint(settings):
             threshold = float(
                 settings.get("vad_threshold", self._vad_processor.threshold)
             )
@@ -5243,28 +5887,25 @@ class MainWindow(QMainWindow):
             )
             self._vad_processor.set_params(threshold, silence, pad_ms)
 
-        # Post-Processing
-        if "min_text_length" in settings:
-            self._min_text_length = int(settings["min_text_length"])
-        if "min_duration" in settings:
-            self._min_duration = float(settings["min_duration"])
-        if "max_duration" in settings:
-            self._max_duration = float(settings["max_duration"])
-        if "rms_threshold" in settings:
-            self._rms_threshold = float(settings["rms_threshold"])
+        # Plain attribute settings: one table lookup per key present
+        for key, value in settings.items():
+            target = _SETTING_ATTRS.get(key)
+            if target is not None:
+                attr, convert = target
+                setattr(self, attr, convert(value))
+
+        # Post-Processing (legacy key first so the specific ones win)
         if "enable_post_processing" in settings:
-            # Legacy fallback
-            val = str(settings["enable_post_processing"]).lower() == "true"
+            val = _str_true(settings["enable_post_processing"])
             self._enable_live_post_processing = val
             self._enable_file_post_processing = val
-
         if "enable_live_post_processing" in settings:
-            self._enable_live_post_processing = (
-                str(settings["enable_live_post_processing"]).lower() == "true"
+            self._enable_live_post_processing = _str_true(
+                settings["enable_live_post_processing"]
             )
         if "enable_file_post_processing" in settings:
-            self._enable_file_post_processing = (
-                str(settings["enable_file_post_processing"]).lower() == "true"
+            self._enable_file_post_processing = _str_true(
+                settings["enable_file_post_processing"]
             )
         if "live_abbrev_whitelist" in settings:
             self._live_abbrev_whitelist = self._normalize_abbrev_list(
@@ -5274,25 +5915,6 @@ class MainWindow(QMainWindow):
             self._stt_abbrev_whitelist = self._normalize_abbrev_list(
                 settings.get("stt_abbrev_whitelist")
             )
-        if "stt_seg_endmin" in settings:
-            self._stt_seg_endmin = float(settings["stt_seg_endmin"])
-        if "stt_extend_on_touch" in settings:
-            self._stt_extend_on_touch = (
-                str(settings["stt_extend_on_touch"]).lower() == "true"
-            )
-        if "stt_pad_before" in settings:
-            self._stt_pad_before = float(settings["stt_pad_before"])
-        if "stt_pad_after" in settings:
-            self._stt_pad_after = float(settings["stt_pad_after"])
-
-        if "live_wordtimestamp_offset" in settings:
-            self._live_wordtimestamp_offset = float(
-                settings["live_wordtimestamp_offset"]
-            )
-        if "live_pad_before" in settings:
-            self._live_pad_before = float(settings["live_pad_before"])
-        if "live_pad_after" in settings:
-            self._live_pad_after = float(settings["live_pad_after"])
 
         if "ui_language" in settings:
             i18n.install_translator(str(settings["ui_language"]))
@@ -5308,24 +5930,14 @@ class MainWindow(QMainWindow):
         # Audio Device Change
         if "mic_index" in settings or "mic_loopback" in settings:
             idx = int(settings.get("mic_index", -1))
+            new_index = idx if idx >= 0 else None
             # User request: remove desktop/loopback capture
-            loopback = False
-            self._audio_recorder.stop()
-            self._audio_recorder.set_device(idx if idx >= 0 else None)
-            self._audio_recorder.start()
-
-        # fw_* formatting settings
-        for key in (
-            "fw_sentence",
-            "fw_max_gap",
-            "fw_max_line_width",
-            "fw_max_line_count",
-            "fw_max_comma_cent",
-            "fw_one_word",
-        ):
-            if key in settings:
-                self._update_overlay_settings()
-                break
+            # Reopening the stream drops live audio; only do it on a real change
+            if new_index != self._current_mic_index:
+                self._audio_recorder.stop()
+                self._audio_recorder.set_device(new_index)
+                self._audio_recorder.start()
+                self._current_mic_index = new_index
 
         # Propagate transcriber settings if running
         if self._transcriber.is_alive:
@@ -5333,21 +5945,30 @@ class MainWindow(QMainWindow):
             if "language" in settings:
                 payload["language"] = settings["language"]
 
-            # Merge '매개변수' tab with '추가 매개변수' JSON (JSON wins on conflicts)
-            if ("faster_whisper_params" in settings) or any(
-                k.startswith("fw_") for k in settings.keys()
-            ):
+            # Merge '매개변수' tab with '추가 매개변수' JSON (JSON wins on conflicts).
+            # Rebuild and push only when the fw inputs differ from the last push.
+            fw_key = tuple(
+                sorted(
+                    (k, repr(v))
+                    for k, v in settings.items()
+                    if k.startswith("fw_") or k == "faster_whisper_params"
+                )
+            )
+            if fw_key and fw_key != self._fw_push_key:
                 payload["faster_whisper_params"] = self._build_fw_params_from_dict(
                     settings
                 )
+                self._fw_push_key = fw_key
 
             if payload:
                 self._transcriber.update_settings(payload)
 
+        # Overlay style and the fw_* split/wrap values are re-read here once
         self._update_overlay_settings()
 
     def _retranslate_ui(self):
         i18n.apply_widget_translations(self)
+        self._state_ui = None  # rebuilt with the new language on next _set_state
         if hasattr(self, "btn_live"):
             self.btn_live.setText(i18n.tr("▶ Live 자막"))
         if hasattr(self, "btn_view"):
@@ -5409,8 +6030,6 @@ class MainWindow(QMainWindow):
             event.ignore()
 
     def dropEvent(self, a0: Optional[QDropEvent]):
-        from pathlib import Path
-
         if a0 is None:
             return
         event = cast(Any, a0)
@@ -5430,21 +6049,25 @@ class MainWindow(QMainWindow):
         except Exception:
             pos = event.pos()
 
+        # Two rect tests in global coordinates instead of walking up from
+        # childAt(); also correct for editors living in floating docks
         target = None
-        w = self.childAt(pos)
-        while w is not None:
-            if w is self.live_editor:
-                target = "left"
+        gpos = self.mapToGlobal(pos)
+        for editor, side in ((self.live_editor, "left"), (self.file_editor, "right")):
+            if editor.isVisible() and QRect(
+                editor.mapToGlobal(QPoint(0, 0)), editor.size()
+            ).contains(gpos):
+                target = side
                 break
-            if w is self.file_editor:
-                target = "right"
-                break
-            w = w.parentWidget()
-
-        media_exts = {".mp3", ".wav", ".m4a", ".mp4", ".mkv", ".flac", ".aac"}
 
-        srt_files = [f for f in files if Path(f).suffix.lower() == ".srt"]
-        media_files = [f for f in files if Path(f).suffix.lower() in media_exts]
+        srt_files = []
+        media_files = []
+        for f in files:
+            ext = os.path.splitext(f)[1].lower()
+            if ext == ".srt":
+                srt_files.append(f)
+            elif ext in _MEDIA_EXTS:
+                media_files.append(f)
 
         # Default target: right (File)
         if target is None:
@@ -5464,13 +6087,23 @@ class MainWindow(QMainWindow):
             self._load_subtitle_file(target="right", path=srt_files[0])
 
             # If matching media exists, set it for media view/export convenience
+            # (one directory listing instead of a stat per media extension)
             srt_path = Path(srt_files[0])
-            for ext in media_exts:
-                cand = srt_path.with_suffix(ext)
-                if cand.exists():
-                    self._selected_media_file = str(cand)
-                    self._load_audio_background(str(cand))
-                    break
+            try:
+                cand = next(
+                    (
+                        p
+                        for p in srt_path.parent.iterdir()
+                        if p.stem == srt_path.stem
+                        and p.suffix.lower() in _MEDIA_EXTS
+                    ),
+                    None,
+                )
+            except OSError:
+                cand = None
+            if cand is not None:
+                self._selected_media_file = str(cand)
+                self._load_audio_background(str(cand))
 
         if media_files:
             media_path = Path(media_files[0])
@@ -5532,6 +6165,7 @@ class MainWindow(QMainWindow):
         settings = QSettings("ThinkSub", "ThinkSub2")
 
         self._transcriber.start(config)
+        self._fw_push_key = None
 
         # If transcriber was already running, start() does nothing.
         # We must explicitly update settings (e.g. word_timestamps, vad_filter)
@@ -5573,8 +6207,8 @@ class MainWindow(QMainWindow):
 
         # 5. Start polling if not already
         if not self._result_timer.isActive():
-            self._result_timer.start(50)
-            self._log_timer.start(100)
+            self._result_timer.start(500)
+            self._log_timer.start(500)
 
     def _toggle_playback(self, segment_id: Optional[str] = None):
         """Handle playback request from editor (Play button)."""
@@ -5756,25 +6390,18 @@ class MainWindow(QMainWindow):
         if not waveform or not manager:
             return
 
-        # 1. Remove
-        for seg_id in removed_ids:
-            waveform.remove_segment_visual(seg_id)
-
-        # 2. Add
-        for seg_id in added_ids:
-            seg = manager.get_segment(seg_id)
-            if seg:
-                waveform.add_segment_visual(seg)
+        if not (added_ids or removed_ids or updated_ids):
+            return
 
-        # 3. Update
-        for seg_id in updated_ids:
-            seg = manager.get_segment(seg_id)
-            if seg:
-                waveform.update_segment_visual(seg)
+        # Resolve ids once, then apply remove/add/update as one batch so the
+        # plot repaints a single time instead of once per changed segment.
+        seg_by_id = {s.id: s for s in manager.segments}
+        added = [seg_by_id[sid] for sid in added_ids if sid in seg_by_id]
+        updated = [seg_by_id[sid] for sid in updated_ids if sid in seg_by_id]
+        waveform.apply_diff(added, removed_ids, updated)
 
         # Repaint
-        if added_ids or removed_ids or updated_ids:
-            waveform.plot_widget.viewport().update()
+        waveform.plot_widget.viewport().update()
 
     def _on_waveform_split_requested(self, segment_id: str, time: float):
         """Handle split request directly from waveform context menu."""
@@ -5908,6 +6535,7 @@ class MainWindow(QMainWindow):
             if seg:
                 seg.start = start
                 seg.end = end
+                manager.mark_changed()
                 # Update editor UI for this segment
                 editor.update_single_segment(seg)
 
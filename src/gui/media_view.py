@@ -37,6 +37,8 @@ class MediaView(QGraphicsView):
         self._right: Optional[SubtitleManager] = None
         self._left: Optional[SubtitleManager] = None
         self._show_left = True
+        # id(manager) -> (segment, raw text, stripped text) of the last hit
+        self._pick_cache: dict[int, tuple] = {}
 
         self._audio = QAudioOutput(self)
         self._player = QMediaPlayer(self)
@@ -44,9 +46,21 @@ class MediaView(QGraphicsView):
         self._current_path: Optional[str] = None
         self._media_loaded = False
         self._debug_last_log_time = -1.0
+        # Debug lines are batched and emitted at most once per second
+        self._debug_buffer: list[str] = []
+        self._debug_timer = QTimer(self)
+        self._debug_timer.setSingleShot(True)
+        self._debug_timer.setInterval(1000)
+        self._debug_timer.timeout.connect(self._flush_debug_log)
 
         self._scene = QGraphicsScene(self)
         self.setScene(self._scene)
+        if self._use_opengl_viewport():
+            # The video item covers most of the scene every frame; tracking
+            # dirty regions costs more than repainting the whole GL surface
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
         self.setFrameShape(QGraphicsView.Shape.NoFrame)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -68,17 +82,48 @@ class MediaView(QGraphicsView):
 
         self._last_viewport_size = QSize(0, 0)
         self._last_layout_log = QSize(0, 0)
+        # (right, left) texts currently shown; None forces the next update
+        self._shown_texts: Optional[tuple[str, str]] = None
+        self._layout_font: Optional[QFont] = None
+        # Resize/Show/Polish of the view and its viewport arrive together;
+        # they share one deferred layout pass
         self._layout_timer = QTimer(self)
-        self._layout_timer.setInterval(200)
-        self._layout_timer.timeout.connect(self._poll_viewport_resize)
-        self._layout_timer.start()
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(0)
+        self._layout_timer.timeout.connect(self._apply_layout)
 
         self._font_size = 18
         self._bg_alpha = 160
         self._bg_color = QColor(0, 0, 0, self._bg_alpha)
         self.update_style()
 
-        self._player.positionChanged.connect(self._on_position_changed)
+        # positionChanged can arrive in bursts (scrubbing, backend catch-up);
+        # only the latest position per event-loop turn is rendered
+        self._pending_position_ms: Optional[int] = None
+        self._position_timer = QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(0)
+        self._position_timer.timeout.connect(self._flush_position)
+        self._player.positionChanged.connect(self._queue_position)
+
+    def _use_opengl_viewport(self) -> bool:
+        """Composite video + overlays on the GPU when an OpenGL context works.
+
+        Set THINKSUB_MEDIA_OPENGL=0 to keep the default raster viewport.
+        """
+        if os.environ.get("THINKSUB_MEDIA_OPENGL", "1") == "0":
+            return False
+        try:
+            from PySide6.QtGui import QOpenGLContext
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            return False
+        # Probe first: a viewport without a usable context renders black
+        probe = QOpenGLContext()
+        if not probe.create():
+            return False
+        self.setViewport(QOpenGLWidget())
+        return True
 
     def _make_subtitle_items(self):
         bg = QGraphicsRectItem(QRectF(0, 0, 0, 0))
@@ -90,30 +135,34 @@ class MediaView(QGraphicsView):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        rect = QRectF(self.viewport().rect())
-        self.setSceneRect(rect)
-        self._update_video_layout()
-        self._layout_subtitles()
+        self._request_layout()
 
-    def showEvent(self, event):
-        super().showEvent(event)
-        self._layout_timer.start()
+    def _request_layout(self):
+        if not self._layout_timer.isActive():
+            self._layout_timer.start()
 
-    def hideEvent(self, event):
-        super().hideEvent(event)
-        self._layout_timer.stop()
+    def _apply_layout(self):
+        self.setSceneRect(QRectF(self.viewport().rect()))
+        self._update_video_layout()
+        self._layout_subtitles()
 
-    def _poll_viewport_resize(self):
+    def _on_viewport_resized(self):
         size = self.viewport().size()
         if size != self._last_viewport_size:
             self._last_viewport_size = size
-            rect = QRectF(self.viewport().rect())
-            self.setSceneRect(rect)
-            self._update_video_layout()
-            self._layout_subtitles()
-            self.debug_log.emit(
-                f"[MediaView] viewport resized: {size.width()}x{size.height()}"
-            )
+            self._request_layout()
+            self._debug(f"[MediaView] viewport resized: {size.width()}x{size.height()}")
+
+    def _debug(self, message: str) -> None:
+        self._debug_buffer.append(message)
+        if not self._debug_timer.isActive():
+            self._debug_timer.start()
+
+    def _flush_debug_log(self) -> None:
+        if self._debug_buffer:
+            lines = self._debug_buffer
+            self._debug_buffer = []
+            self.debug_log.emit("\n".join(lines))
 
     def _update_video_layout(self):
         rect = QRectF(self.viewport().rect())
@@ -130,12 +179,13 @@ class MediaView(QGraphicsView):
         self._video_item.setPos(x, y)
 
     def eventFilter(self, obj, event):
-        if obj is self.viewport() and event.type() in (
-            QEvent.Type.Resize,
-            QEvent.Type.Show,
-            QEvent.Type.PolishRequest,
-        ):
-            self._layout_subtitles()
+        if obj is self.viewport():
+            etype = event.type()
+            if etype == QEvent.Type.Resize:
+                # Qt reports every viewport geometry change here; no polling
+                self._on_viewport_resized()
+            elif etype in (QEvent.Type.Show, QEvent.Type.PolishRequest):
+                self._request_layout()
         return super().eventFilter(obj, event)
 
     def set_media(self, path: str):
@@ -166,13 +216,31 @@ class MediaView(QGraphicsView):
 
     def set_position(self, ms: int):
         self._player.setPosition(ms)
+        self._cancel_pending_position()
         self._on_position_changed(ms)
 
     def set_time(self, seconds: float):
         if seconds < 0:
             seconds = 0.0
+        self._cancel_pending_position()
         self._on_position_changed(int(seconds * 1000))
 
+    def _queue_position(self, ms: int):
+        self._pending_position_ms = ms
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+
+    def _flush_position(self):
+        ms = self._pending_position_ms
+        self._pending_position_ms = None
+        if ms is not None:
+            self._on_position_changed(ms)
+
+    def _cancel_pending_position(self):
+        # An explicit seek supersedes any player tick still queued
+        self._pending_position_ms = None
+        self._position_timer.stop()
+
     def mousePressEvent(self, event):
         if event and event.button() == Qt.MouseButton.LeftButton:
             self.playback_toggle_requested.emit()
@@ -187,6 +255,10 @@ class MediaView(QGraphicsView):
         if len(parts) < 3:
             parts = [0, 0, 0]
         self._bg_color = QColor(parts[0], parts[1], parts[2], alpha)
+        # The brush only changes here; layout passes leave it alone
+        self._bg_brush = QBrush(self._bg_color)
+        self._subtitle_top_bg.setBrush(self._bg_brush)
+        self._subtitle_bottom_bg.setBrush(self._bg_brush)
 
         font = QFont()
         font.setPixelSize(int(self._font_size))
@@ -208,20 +280,29 @@ class MediaView(QGraphicsView):
     def _pick_text_at_time(self, mgr: Optional[SubtitleManager], t: float) -> str:
         if mgr is None:
             return ""
-        for seg in mgr.segments:
-            if getattr(seg, "is_hidden", False):
-                continue
-            if seg.start <= t <= seg.end:
-                return (seg.text or "").strip()
-        return ""
+        # find_segment_at already resumes from the previous hit (galloping
+        # search), so playback ticks are O(1); only the text is memoized here
+        seg = mgr.find_segment_at(t)
+        if seg is None:
+            return ""
+        raw = seg.text
+        cached = self._pick_cache.get(id(mgr))
+        if cached is not None and cached[0] is seg and cached[1] is raw:
+            return cached[2]
+        text = (raw or "").strip()
+        self._pick_cache[id(mgr)] = (seg, raw, text)
+        return text
 
     def _layout_subtitles(self):
         rect = QRectF(self.viewport().rect())
         padding_x = 12
         padding_y = 4
         font_px = max(12, int(rect.height() * 0.045))
-        font = QFont()
-        font.setPixelSize(font_px)
+        font = self._layout_font
+        if font is None or font.pixelSize() != font_px:
+            font = QFont()
+            font.setPixelSize(font_px)
+            self._layout_font = font
         self._subtitle_top.setFont(font)
         self._subtitle_bottom.setFont(font)
         bottom_margin = 18
@@ -240,7 +321,6 @@ class MediaView(QGraphicsView):
             bottom_bounds.height() + padding_y * 2,
         )
         self._subtitle_bottom_bg.setRect(bottom_bg_rect)
-        self._subtitle_bottom_bg.setBrush(QBrush(self._bg_color))
 
         self._subtitle_top.setTextWidth(-1)
         top_bounds = self._subtitle_top.boundingRect()
@@ -255,24 +335,22 @@ class MediaView(QGraphicsView):
             top_bounds.height() + padding_y * 2,
         )
         self._subtitle_top_bg.setRect(top_bg_rect)
-        self._subtitle_top_bg.setBrush(QBrush(self._bg_color))
 
         if rect.size().toSize() != self._last_layout_log:
             self._last_layout_log = rect.size().toSize()
-            self.debug_log.emit(
+            self._debug(
                 f"[MediaView] layout size={rect.width():.0f}x{rect.height():.0f} font_px={font_px}"
             )
 
     def _set_subtitle_text(self, text_item, bg_item, text: str) -> None:
+        # Gaps between lines: leave the hidden item's document untouched
+        if not text and not text_item.isVisible():
+            return
+        # The font is applied by _layout_subtitles, which always follows
         text_item.setPlainText(text)
         visible = bool(text)
         text_item.setVisible(visible)
         bg_item.setVisible(visible)
-        if visible:
-            base_font = QFont(text_item.font())
-            base_font.setPointSize(self._font_size)
-            text_item.setFont(base_font)
-        self._layout_subtitles()
 
     def _on_position_changed(self, ms: int):
         t = float(ms) / 1000.0
@@ -281,14 +359,24 @@ class MediaView(QGraphicsView):
         right_text = self._pick_text_at_time(self._right, t)
         left_text = self._pick_text_at_time(self._left, t) if self._show_left else ""
 
-        self._set_subtitle_text(
-            self._subtitle_bottom, self._subtitle_bottom_bg, right_text
-        )
-        self._set_subtitle_text(self._subtitle_top, self._subtitle_top_bg, left_text)
+        # Most ticks land inside the same segment(s): nothing to relayout.
+        # Viewport and style changes relayout on their own.
+        shown = self._shown_texts
+        if (right_text, left_text) != shown:
+            self._shown_texts = (right_text, left_text)
+            if shown is None or right_text != shown[0]:
+                self._set_subtitle_text(
+                    self._subtitle_bottom, self._subtitle_bottom_bg, right_text
+                )
+            if shown is None or left_text != shown[1]:
+                self._set_subtitle_text(
+                    self._subtitle_top, self._subtitle_top_bg, left_text
+                )
+            self._layout_subtitles()
 
         if self._debug_last_log_time < 0 or abs(t - self._debug_last_log_time) >= 1.0:
             self._debug_last_log_time = t
-            self.debug_log.emit(
+            self._debug(
                 f"[MediaView] t={t:.2f} right_len={len(right_text)} left_len={len(left_text)}"
             )
 
@@ -117,6 +117,8 @@ class WaveformWidget(QWidget):
         # Subtitle overlays (reused items)
         self._segment_items: Dict[str, pg.LinearRegionItem] = {}
         self._word_lines: Dict[str, List[pg.InfiniteLine]] = {}
+        # Word tuples each _word_lines entry was built from (skip identical rebuilds)
+        self._word_sources: Dict[str, List[tuple]] = {}
         self._segment_times: Dict[str, tuple[float, float]] = {}
         self._segment_bounds: Dict[str, tuple[float, float | None]] = {}
 
@@ -919,8 +921,11 @@ class WaveformWidget(QWidget):
             return
 
         try:
-            # 1. Concatenate ALL data
-            full_data = np.concatenate(self._audio_store)
+            # 1. Concatenate ALL data (a file load is one chunk: use it as-is)
+            if len(self._audio_store) == 1:
+                full_data = self._audio_store[0]
+            else:
+                full_data = np.concatenate(self._audio_store)
             self._full_audio_cache = full_data
             self._full_render_mode = True
 
@@ -1171,22 +1176,19 @@ class WaveformWidget(QWidget):
     def _build_pixel_waveform(
         self, data: np.ndarray, start_time: float, end_time: float, bins: int
     ) -> tuple[np.ndarray, np.ndarray]:
-        boosted = np.clip(data * self._visual_gain, -1.0, 1.0)
-        if len(boosted) == 0:
+        if len(data) == 0:
             return np.array([], dtype=np.float32), np.array([], dtype=np.float32)
 
-        bins = max(1, min(bins, len(boosted)))
-        edges = np.linspace(0, len(boosted), bins + 1, dtype=int)
-        mins = np.empty(bins, dtype=np.float32)
-        maxs = np.empty(bins, dtype=np.float32)
-        for i in range(bins):
-            segment = boosted[edges[i] : edges[i + 1]]
-            if segment.size == 0:
-                mins[i] = 0.0
-                maxs[i] = 0.0
-            else:
-                mins[i] = float(np.min(segment))
-                maxs[i] = float(np.max(segment))
+        # Reduce the raw samples per bin first and boost only the bin extrema;
+        # gain and clip are monotonic, so this matches boosting every sample
+        # without allocating two full-length temporaries.
+        bins = max(1, min(bins, len(data)))
+        edges = np.linspace(0, len(data), bins + 1, dtype=int)[:-1]
+        mins = np.minimum.reduceat(data, edges).astype(np.float32, copy=False)
+        maxs = np.maximum.reduceat(data, edges).astype(np.float32, copy=False)
+        gain = self._visual_gain
+        np.clip(mins * gain, -1.0, 1.0, out=mins)
+        np.clip(maxs * gain, -1.0, 1.0, out=maxs)
 
         x_bins = np.linspace(start_time, end_time, len(mins))
         x_data = np.repeat(x_bins, 2)
@@ -1252,12 +1254,14 @@ class WaveformWidget(QWidget):
         if time < 0:
             self._dbg(f"[CURSOR] SKIP negative time={time:.3f}s")
             return
+        # setPos() already schedules the line's repaint; Qt merges it with the
+        # other waveform's into the next paint pass, so no explicit update().
         self.scroll_cursor_line.setPos(time)
-        self.scroll_cursor_line.setVisible(True)
+        if not self.scroll_cursor_line.isVisible():
+            self.scroll_cursor_line.setVisible(True)
 
         # DEBUG LOG: Cursor position updated
         self._dbg(f"[CURSOR_LINE] position updated to time={time:.3f}s")
-        self.scroll_cursor_line.update()  # Force repaint (InfiniteLine has update(), not repaint())
 
         if emit:
             self._dbg(
@@ -1383,6 +1387,22 @@ class WaveformWidget(QWidget):
             self.plot_widget.addItem(item)
             self._segment_items[segment_id] = item
 
+    def add_segment_overlays(self, entries: List[tuple]):
+        """Add/update several overlays with one repaint.
+
+        entries: List of (segment_id, start, end, is_final, words or None)
+        """
+        if not entries:
+            return
+        self.plot_widget.setUpdatesEnabled(False)
+        try:
+            for segment_id, start, end, is_final, words in entries:
+                self.add_segment_overlay(segment_id, start, end, is_final)
+                if words:
+                    self.add_word_timestamps(segment_id, words)
+        finally:
+            self.plot_widget.setUpdatesEnabled(True)
+
     def add_word_timestamps(self, segment_id: str, words: List[tuple]):
         """
         Add word timestamp lines for a segment.
@@ -1391,6 +1411,13 @@ class WaveformWidget(QWidget):
         if not self._show_word_timestamps:
             return
 
+        # Unchanged words: keep the existing lines and text items
+        if (
+            segment_id in self._word_lines
+            and self._word_sources.get(segment_id) == words
+        ):
+            return
+
         # Remove old lines if any (REUSE pool)
         if segment_id in self._word_lines:
             for line in self._word_lines[segment_id]:
@@ -1428,6 +1455,7 @@ class WaveformWidget(QWidget):
             lines.append(text_item)
 
         self._word_lines[segment_id] = lines
+        self._word_sources[segment_id] = list(words)
         self.plot_widget.update()
 
     def refresh_segments(self, segments):
@@ -1460,6 +1488,7 @@ class WaveformWidget(QWidget):
                 for line in self._word_lines[sid]:
                     self.plot_widget.removeItem(line)
                 del self._word_lines[sid]
+            self._word_sources.pop(sid, None)
 
         # 2. Add/Update existing
         for seg in segments:
@@ -1520,6 +1549,7 @@ class WaveformWidget(QWidget):
                 for line in self._word_lines[sid]:
                     self.plot_widget.removeItem(line)
                 del self._word_lines[sid]
+            self._word_sources.pop(sid, None)
 
     def remove_segment_visual(self, segment_id: str):
         if segment_id in self._segment_items:
@@ -1529,6 +1559,7 @@ class WaveformWidget(QWidget):
             for line in self._word_lines[segment_id]:
                 self.plot_widget.removeItem(line)
             del self._word_lines[segment_id]
+        self._word_sources.pop(segment_id, None)
         if segment_id in self._segment_times:
             del self._segment_times[segment_id]
             self._recompute_segment_bounds()
@@ -1685,6 +1716,7 @@ class WaveformWidget(QWidget):
             for line in lines:
                 self.plot_widget.removeItem(line)
         self._word_lines.clear()
+        self._word_sources.clear()
 
         # Re-add from cached segments
         for seg in getattr(self, "_last_segments", []):
@@ -1725,6 +1757,7 @@ class WaveformWidget(QWidget):
             for line in lines:
                 self.plot_widget.removeItem(line)
         self._word_lines.clear()
+        self._word_sources.clear()
 
     def seek_to(self, time: float):
         """
@@ -0,0 +1,86 @@
+import sys
+import os
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.engine.subtitle import SubtitleManager, SubtitleSegment
+
+
+def _seg(sid, start, end, hidden=False):
+    return SubtitleSegment(id=sid, start=start, end=end, text=sid, is_hidden=hidden)
+
+
+class TestSubtitleTimeIndex(unittest.TestCase):
+
+    def _manager(self, *segments):
+        manager = SubtitleManager()
+        manager.add_segments(list(segments))
+        return manager
+
+    def test_find_segment_at_basic(self):
+        manager = self._manager(_seg("a", 0, 1), _seg("b", 2, 3))
+        self.assertEqual(manager.find_segment_at(0.5).id, "a")
+        self.assertEqual(manager.find_segment_at(2.5).id, "b")
+        self.assertIsNone(manager.find_segment_at(1.5))
+        self.assertIsNone(manager.find_segment_at(-1.0))
+        self.assertIsNone(manager.find_segment_at(5.0))
+
+    def test_find_segment_at_nested_overlap(self):
+        """A long segment covering later ones wins, like a forward scan."""
+        manager = self._manager(_seg("a", 0, 10), _seg("b", 2, 3), _seg("c", 4, 5))
+        self.assertEqual(manager.find_segment_at(6.0).id, "a")
+        self.assertEqual(manager.find_segment_at(4.5).id, "a")
+        self.assertEqual(manager.find_segment_at(2.5).id, "a")
+        self.assertIsNone(manager.find_segment_at(10.5))
+
+    def test_find_segment_at_matches_linear_scan(self):
+        manager = self._manager(
+            _seg("a", 0, 4),
+            _seg("b", 1, 2),
+            _seg("c", 3, 8),
+            _seg("d", 5, 6, hidden=True),
+            _seg("e", 7, 9),
+            _seg("f", 12, 13),
+        )
+        visible = [s for s in manager.segments if not s.is_hidden]
+        for step in range(0, 150):
+            t = step / 10.0
+            expected = next((s for s in visible if s.start <= t <= s.end), None)
+            self.assertIs(manager.find_segment_at(t), expected, f"t={t}")
+        # Random-order queries (seeks) must agree too
+        for t in (12.5, 0.5, 7.5, 2.0, 10.0, 5.5):
+            expected = next((s for s in visible if s.start <= t <= s.end), None)
+            self.assertIs(manager.find_segment_at(t), expected, f"t={t}")
+
+    def test_clear_invalidates_index(self):
+        manager = self._manager(_seg("old", 0, 1))
+        self.assertEqual(manager.find_segment_at(0.5).id, "old")
+        manager.clear()
+        manager.add_segments([_seg("new", 10, 11)])
+        self.assertIsNone(manager.find_segment_at(0.5))
+        self.assertEqual(manager.find_segment_at(10.5).id, "new")
+
+    def test_in_place_edit_after_mark_changed(self):
+        manager = self._manager(_seg("a", 0, 1), _seg("b", 2, 3))
+        self.assertIsNone(manager.find_segment_at(5.0))
+        manager.segments[1].end = 6.0
+        manager.mark_changed()
+        self.assertEqual(manager.find_segment_at(5.0).id, "b")
+
+    def test_in_place_end_extension_without_mark_changed(self):
+        manager = self._manager(_seg("a", 0, 1), _seg("b", 2, 3))
+        self.assertIsNone(manager.find_segment_at(4.0))
+        manager.segments[-1].end = 5.0
+        self.assertEqual(manager.find_segment_at(4.0).id, "b")
+
+    def test_find_nearest_segment(self):
+        manager = self._manager(_seg("a", 0, 1), _seg("b", 5, 6))
+        self.assertEqual(manager.find_nearest_segment(0.5).id, "a")
+        self.assertEqual(manager.find_nearest_segment(4.0).id, "b")
+        self.assertEqual(manager.find_closest_start_segment(1.5).id, "a")
+
+
+if __name__ == "__main__":
+    unittest.main()